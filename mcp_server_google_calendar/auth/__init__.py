@@ -1,6 +1,12 @@
 """Authentication module for Google Calendar API."""
 
-from .auth import authorize
+from .auth import authorize, authorize_async, authorize_cached, clear_cached_credentials
 from .scopes import SCOPES
 
-__all__ = ["authorize", "SCOPES"] 
\ No newline at end of file
+__all__ = [
+    "authorize",
+    "authorize_async",
+    "authorize_cached",
+    "clear_cached_credentials",
+    "SCOPES",
+] 
\ No newline at end of file
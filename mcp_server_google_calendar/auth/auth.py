@@ -1,49 +1,362 @@
 """Google Calendar API authentication."""
 
-import json
+import asyncio
 import os
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+
+try:
+    import orjson as _json
+except ImportError:  # optional speedup
+    import json as _json
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional; the mtime check in load_saved_credentials is used instead
+    Observer = None
 
 from .scopes import SCOPES
 
+_HERE = Path(__file__).resolve()
+_PROJECT_ROOT = _HERE.parents[3]
+_TOKEN_PATH = _PROJECT_ROOT / "token.json"
+_TOKEN_LOG_PATH = _PROJECT_ROOT / "token.json.log"
+_CREDENTIALS_PATH = (
+    _PROJECT_ROOT / "google-calendar-mcp" / "mcp_server_google_calendar" / "credentials.json"
+)
+
+# token.json holds the credentials as a single JSON document, the format
+# other tools read. Refreshed credentials are appended as one line each to
+# token.json.log instead, whose last line wins; once per process the log is
+# folded back into token.json. _token_lock serializes this process's writes.
+_TOKEN_TAIL_CHUNK = 4096
+_token_lock = threading.Lock()
+_token_log_compacted = False
+
+# Parsed credentials keyed by (token path, token mtime_ns, log mtime_ns) so
+# unchanged token files are not re-read and re-parsed on every authorize() call.
+_CREDS_CACHE: dict[tuple[str, int, int], Credentials] = {}
+
+# With watchdog installed, token.json changes are pushed to us and the cached
+# credentials are served without even a stat() until the file changes
+_token_observer = None
+_token_dirty = True
+
+# Credentials closer than this to expiry are refreshed in the background
+_REFRESH_AHEAD_SECONDS = 300
+
+_refresh_lock = threading.Lock()
+_refresh_inflight = False
+
+# After a failed background refresh no new one starts before this time, so a
+# failing token endpoint is not hit again on every request
+_REFRESH_RETRY_SECONDS = 30
+_refresh_retry_at = 0.0
+
+# Credentials handed out by authorize_cached() while they have at least
+# _CACHED_MIN_TTL_SECONDS of validity left
+_CREDS_SINGLETON: Optional[Credentials] = None
+_CACHED_MIN_TTL_SECONDS = 60
+
+# Wall-clock times derived from the shared credentials' expiry. Before
+# _singleton_refresh_at the cached credentials are returned after a single
+# clock read, without any helper calls or expiry arithmetic.
+_singleton_refresh_at = 0.0
+_singleton_deadline = 0.0
+
+# Shared transport for token refreshes so the connection to Google's token
+# endpoint is kept alive between refreshes
+_AUTH_REQUEST = None
+
 
 def get_project_root() -> Path:
     """Get the project root directory."""
-    return Path(__file__).parent.parent.parent.parent
+    return _PROJECT_ROOT
 
 
 def get_token_path() -> Path:
     """Get the path to the token file."""
-    return get_project_root() / "token.json"
+    return _TOKEN_PATH
+
+
+def get_token_log_path() -> Path:
+    """Get the path to the log of refreshed tokens."""
+    return _TOKEN_LOG_PATH
 
 
 def get_credentials_path() -> Path:
     """Get the path to the credentials file."""
-    return get_project_root() / "google-calendar-mcp" / "mcp_server_google_calendar" / "credentials.json"
+    return _CREDENTIALS_PATH
+
+
+def _start_token_watcher() -> None:
+    """Start watching token.json and its log for changes if watchdog is available."""
+    global _token_observer
+    if _token_observer is not None or Observer is None:
+        return
+
+    watched = {str(get_token_path()), str(get_token_log_path())}
+
+    class _TokenFileHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            global _token_dirty
+            if event.src_path in watched or getattr(event, "dest_path", "") in watched:
+                _token_dirty = True
+
+    try:
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_TokenFileHandler(), str(get_token_path().parent), recursive=False)
+        observer.start()
+    except Exception:
+        return
+    _token_observer = observer
+
+
+def _read_token_tail(log_path: Path) -> tuple[bytes, bool]:
+    """Read the last non-empty line of the token log without reading it all.
+
+    Returns the line and whether the file ends with a newline.
+    """
+    with open(log_path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        line_start = -1
+        while pos > 0:
+            step = min(_TOKEN_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            line_start = buf.rstrip(b"\r\n").rfind(b"\n")
+            if line_start != -1:
+                break
+    return buf.rstrip(b"\r\n")[line_start + 1:], buf.endswith(b"\n")
+
+
+def _parse_token_entry(line: bytes) -> Optional[dict]:
+    """Parse one token log line, or None if it is not a complete JSON object."""
+    try:
+        entry = _json.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _last_log_entry(log_path: Path) -> Optional[bytes]:
+    """Get the last token log line if it is a complete entry."""
+    try:
+        last_line, _ = _read_token_tail(log_path)
+    except OSError:
+        return None
+    return last_line if _parse_token_entry(last_line) is not None else None
+
+
+def _legacy_token_entry(token_path: Path) -> Optional[bytes]:
+    """Get the last entry of a token.json that was itself written as a log.
+
+    Earlier versions appended to token.json directly; compaction rewrites
+    such a file as a single document.
+    """
+    try:
+        data = token_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        _json.loads(data)
+        return None  # already a single document
+    except ValueError:
+        pass
+    lines = data.strip().splitlines()
+    return lines[-1] if lines and _parse_token_entry(lines[-1]) is not None else None
+
+
+def _write_token_file(token_path: Path, data: bytes) -> None:
+    """Replace token.json atomically so readers never see a partial document."""
+    tmp_path = token_path.with_name(token_path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, token_path)
+
+
+def _compact_token_log(token_path: Path, log_path: Path) -> None:
+    """Fold the token log back into token.json, once per process."""
+    global _token_log_compacted
+    with _token_lock:
+        if _token_log_compacted:
+            return
+        _token_log_compacted = True
+        entry = _last_log_entry(log_path) or _legacy_token_entry(token_path)
+        try:
+            if entry is not None and token_path.exists():
+                _write_token_file(token_path, entry)
+            log_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _mtime_ns(path: Path) -> int:
+    """Get a file's mtime in nanoseconds, or 0 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
 
 
 def load_saved_credentials() -> Optional[Credentials]:
-    """Load saved credentials from token.json if it exists."""
+    """Load saved credentials from token.json and its log if they exist."""
+    global _token_dirty
+    if _token_observer is not None and not _token_dirty and _CREDS_CACHE:
+        return next(iter(_CREDS_CACHE.values()))
+
+    _start_token_watcher()
+    # Cleared before reading so a write racing with the read marks it dirty again
+    _token_dirty = False
+
     token_path = get_token_path()
-    if token_path.exists():
-        try:
-            return Credentials.from_authorized_user_info(
-                json.loads(token_path.read_text()), SCOPES
-            )
-        except Exception:
-            return None
-    return None
+    log_path = get_token_log_path()
+    _compact_token_log(token_path, log_path)
+    # Without token.json there is nothing to load; deleting it forces
+    # re-authentication even if a log is left behind
+    token_mtime = _mtime_ns(token_path)
+    if not token_mtime:
+        return None
+    log_mtime = _mtime_ns(log_path)
+
+    key = (str(token_path), token_mtime, log_mtime)
+    cached = _CREDS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        entry = _last_log_entry(log_path) if log_mtime else None
+        if entry is None:
+            entry = token_path.read_bytes()
+        creds = Credentials.from_authorized_user_info(_json.loads(entry), SCOPES)
+    except Exception:
+        return None
+
+    # A rewritten token file gets a new mtime, so older entries are stale
+    _CREDS_CACHE.clear()
+    _CREDS_CACHE[key] = creds
+    return creds
 
 
 def save_credentials(creds: Credentials) -> None:
-    """Save credentials to token.json."""
+    """Save credentials to token.json, or append refreshed ones to the token log."""
     token_path = get_token_path()
-    token_path.write_text(creds.to_json())
+    log_path = get_token_log_path()
+    new = creds.to_json().encode()
+    with _token_lock:
+        if not token_path.exists():
+            # New credentials: entries in a leftover log belong to older ones
+            _write_token_file(token_path, new)
+            log_path.unlink(missing_ok=True)
+            return
+
+        separator = b""
+        try:
+            last_line, terminated = _read_token_tail(log_path)
+            if last_line == new:
+                return
+            if last_line and not terminated:
+                separator = b"\n"
+        except OSError:
+            pass
+
+        # A single append per refresh; no rename and no fsync. Losing the token
+        # in a crash only means re-authenticating.
+        with open(log_path, "ab") as f:
+            f.write(separator + new + b"\n")
+
+
+def _get_auth_request():
+    """Get the shared google-auth transport, creating it on first use."""
+    global _AUTH_REQUEST
+    if _AUTH_REQUEST is None:
+        import requests
+        from google.auth.transport.requests import Request
+        _AUTH_REQUEST = Request(session=requests.Session())
+    return _AUTH_REQUEST
+
+
+def _seconds_until_expiry(creds: Credentials) -> float:
+    """Get the number of seconds until the access token expires."""
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (creds.expiry - now).total_seconds()
+
+
+def _needs_background_refresh(creds: Credentials) -> bool:
+    """Check whether still-valid credentials are about to expire."""
+    if not (creds.valid and creds.expiry and creds.refresh_token):
+        return False
+    return _seconds_until_expiry(creds) < _REFRESH_AHEAD_SECONDS
+
+
+def _bg_refresh(creds: Credentials) -> None:
+    """Refresh credentials and persist them, off the request path."""
+    global _refresh_inflight, _refresh_retry_at
+    import sys
+    try:
+        creds.refresh(_get_auth_request())
+        save_credentials(creds)
+        print("Credentials refreshed in the background.", file=sys.stderr)
+    except Exception as e:
+        _refresh_retry_at = time.time() + _REFRESH_RETRY_SECONDS
+        print(f"Background credential refresh failed: {e}", file=sys.stderr)
+    finally:
+        with _refresh_lock:
+            _refresh_inflight = False
+
+
+def _schedule_background_refresh(creds: Credentials) -> None:
+    """Start a background refresh unless one is running or a failed one is backing off."""
+    global _refresh_inflight
+    with _refresh_lock:
+        if _refresh_inflight or time.time() < _refresh_retry_at:
+            return
+        _refresh_inflight = True
+    threading.Thread(target=_bg_refresh, args=(creds,), daemon=True).start()
+
+
+def _run_oauth_flow(credentials_path: Path, headless: bool) -> Credentials:
+    """Run the OAuth installed-app flow with a local redirect server.
+
+    Without a browser on this machine (headless) only the authorization URL
+    is shown; the redirect server listens on MCP_GCAL_OAUTH_PORT (default
+    8080) so that port can be forwarded from the machine with the browser,
+    e.g. with ssh -L. Nothing is read from stdin and nothing is written to
+    stdout, which carry the MCP protocol in stdio mode.
+    """
+    import sys
+    from contextlib import redirect_stdout
+
+    # Only pulled in when the interactive flow is actually needed
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    flow = InstalledAppFlow.from_client_secrets_file(str(credentials_path), SCOPES)
+    # run_local_server prints its prompt with print()
+    with redirect_stdout(sys.stderr):
+        if not headless:
+            print("Starting OAuth flow - your browser will open...")
+            return flow.run_local_server(port=0)
+        if not sys.stderr.isatty():
+            raise RuntimeError(
+                "Headless authorization shows its URL on the terminal; run the "
+                "server once from a terminal with MCP_GCAL_HEADLESS_AUTH=1."
+            )
+        return flow.run_local_server(
+            port=int(os.getenv("MCP_GCAL_OAUTH_PORT", "8080")),
+            open_browser=False,
+            authorization_prompt_message=(
+                "Open this URL in a browser to authorize access:\n{url}"
+            ),
+        )
 
 
 def authorize() -> Credentials:
@@ -58,7 +371,7 @@ def authorize() -> Credentials:
         if creds and creds.expired and creds.refresh_token:
             print("Refreshing expired credentials...", file=sys.stderr)
             try:
-                creds.refresh(Request())
+                creds.refresh(_get_auth_request())
                 print("Credentials refreshed successfully!", file=sys.stderr)
             except Exception as e:
                 print(f"Failed to refresh credentials: {e}", file=sys.stderr)
@@ -74,11 +387,9 @@ def authorize() -> Credentials:
                     "Please download your OAuth2 credentials from Google Cloud Console and save as 'credentials.json' in the project root."
                 )
             
-            print("Starting OAuth flow - your browser will open...", file=sys.stderr)
-            flow = InstalledAppFlow.from_client_secrets_file(
-                str(credentials_path), SCOPES
+            creds = _run_oauth_flow(
+                credentials_path, headless=os.getenv("MCP_GCAL_HEADLESS_AUTH") == "1"
             )
-            creds = flow.run_local_server(port=0)
             print("Authentication completed successfully!", file=sys.stderr)
         
         # Save the credentials for the next run
@@ -86,5 +397,83 @@ def authorize() -> Credentials:
         print("Credentials saved for future use.", file=sys.stderr)
     else:
         print("Using existing valid credentials.", file=sys.stderr)
+        # Refresh ahead of expiry so no request has to wait on the token endpoint
+        if _needs_background_refresh(creds):
+            _schedule_background_refresh(creds)
     
-    return creds 
\ No newline at end of file
+    return creds 
+
+
+def _set_singleton(creds: Optional[Credentials]) -> None:
+    """Share credentials and recompute the fast-path deadlines from their expiry."""
+    global _CREDS_SINGLETON, _singleton_refresh_at, _singleton_deadline
+    _CREDS_SINGLETON = creds
+    if creds is None or creds.expiry is None:
+        _singleton_refresh_at = _singleton_deadline = 0.0
+        return
+    expires_at = creds.expiry.replace(tzinfo=timezone.utc).timestamp()
+    _singleton_deadline = expires_at - _CACHED_MIN_TTL_SECONDS
+    _singleton_refresh_at = expires_at - _REFRESH_AHEAD_SECONDS
+
+
+def _cached_credentials() -> Optional[Credentials]:
+    """Return the shared credentials if they are comfortably far from expiry."""
+    creds = _CREDS_SINGLETON
+    if creds is None or not creds.valid or creds.expiry is None:
+        return None
+    # Picks up a new expiry written by a background refresh
+    _set_singleton(creds)
+    now = time.time()
+    if now >= _singleton_deadline:
+        return None
+    if now >= _singleton_refresh_at and creds.refresh_token:
+        _schedule_background_refresh(creds)
+    return creds
+
+
+def clear_cached_credentials() -> None:
+    """Drop the shared credentials, e.g. after they were revoked."""
+    _set_singleton(None)
+
+
+def authorize_cached() -> Credentials:
+    """Authorize once and share the credentials across subsequent calls."""
+    if time.time() < _singleton_refresh_at:
+        return _CREDS_SINGLETON
+    creds = _cached_credentials()
+    if creds is None:
+        creds = authorize()
+        _set_singleton(creds)
+    return creds
+
+
+async def authorize_async() -> Credentials:
+    """Authorize without blocking the event loop on file or network I/O."""
+    import sys
+    if time.time() < _singleton_refresh_at:
+        return _CREDS_SINGLETON
+    creds = _cached_credentials()
+    if creds is not None:
+        return creds
+
+    creds = await asyncio.to_thread(load_saved_credentials)
+
+    if creds and creds.valid:
+        if _needs_background_refresh(creds):
+            _schedule_background_refresh(creds)
+        _set_singleton(creds)
+        return creds
+
+    if creds and creds.expired and creds.refresh_token:
+        try:
+            await asyncio.to_thread(creds.refresh, _get_auth_request())
+            await asyncio.to_thread(save_credentials, creds)
+            _set_singleton(creds)
+            return creds
+        except Exception as e:
+            print(f"Failed to refresh credentials: {e}", file=sys.stderr)
+
+    # No usable token: run the full (interactive) flow in a worker thread
+    creds = await asyncio.to_thread(authorize)
+    _set_singleton(creds)
+    return creds
@@ -1,146 +1,212 @@
 """Pydantic schemas for Google Calendar MCP server."""
 
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, EmailStr
+from enum import Enum
+from typing import Annotated, List, Optional, Required, TypedDict
 
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, with_config
 
-class DateTime(BaseModel):
+# Enum fields are stored as their plain string values so they can be
+# passed straight to the Google API client. Validators are built when each
+# class is defined (defer_build=False), i.e. at import, so the first tool call
+# does not pay for building them and model_rebuild() is never needed.
+_SCHEMA_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_assignment=False,
+    use_enum_values=True,
+    arbitrary_types_allowed=False,
+    defer_build=False,
+)
+
+
+# Structural email check; pydantic compiles the pattern once at schema build
+_EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+EmailAddress = Annotated[str, StringConstraints(pattern=_EMAIL_RE, min_length=3, max_length=254)]
+
+
+class _Schema(BaseModel):
+    """Base model sharing one validation config across all schemas."""
+    model_config = _SCHEMA_CONFIG
+
+
+class ResponseStatus(str, Enum):
+    """Attendee response status."""
+    needsAction = "needsAction"
+    declined = "declined"
+    tentative = "tentative"
+    accepted = "accepted"
+
+
+class ReminderMethod(str, Enum):
+    """Reminder delivery method."""
+    email = "email"
+    popup = "popup"
+
+
+class Visibility(str, Enum):
+    """Event visibility."""
+    default = "default"
+    public = "public"
+    private = "private"
+    confidential = "confidential"
+
+
+class Transparency(str, Enum):
+    """Whether an event blocks time on the calendar."""
+    opaque = "opaque"
+    transparent = "transparent"
+
+
+class SendUpdates(str, Enum):
+    """Which attendees receive change notifications."""
+    all = "all"
+    externalOnly = "externalOnly"
+    none = "none"
+
+
+class OrderBy(str, Enum):
+    """Sort order for listed events."""
+    startTime = "startTime"
+    updated = "updated"
+
+
+class DateTime(_Schema):
     """DateTime schema for Google Calendar events."""
     dateTime: str = Field(..., description="RFC3339 timestamp")
     timeZone: Optional[str] = Field(None, description="Time zone")
 
 
-class Attendee(BaseModel):
-    """Attendee schema for Google Calendar events."""
-    email: EmailStr = Field(..., description="Attendee's email address")
-    displayName: Optional[str] = Field(None, description="Attendee's display name")
-    optional: Optional[bool] = Field(False, description="Whether attendee is optional")
-    responseStatus: Optional[Literal["needsAction", "declined", "tentative", "accepted"]] = Field(
-        "needsAction", description="Attendee's response status"
-    )
-    comment: Optional[str] = Field(None, description="Attendee's response comment")
-    additionalGuests: Optional[int] = Field(0, ge=0, description="Number of additional guests")
+@with_config(_SCHEMA_CONFIG)
+class AttendeeDict(TypedDict, total=False):
+    """Attendee schema for Google Calendar events.
+
+    A TypedDict rather than a model, so attendee lists validate in a single
+    pass into plain dicts that can be sent to the API as-is.
+    """
+    email: Required[Annotated[EmailAddress, Field(description="Attendee's email address")]]
+    displayName: Annotated[Optional[str], Field(description="Attendee's display name")]
+    optional: Annotated[Optional[bool], Field(description="Whether attendee is optional")]
+    responseStatus: Annotated[Optional[ResponseStatus], Field(description="Attendee's response status")]
+    comment: Annotated[Optional[str], Field(description="Attendee's response comment")]
+    additionalGuests: Annotated[Optional[int], Field(ge=0, description="Number of additional guests")]
+
 
+@with_config(_SCHEMA_CONFIG)
+class AttachmentDict(TypedDict, total=False):
+    """Attachment schema for Google Calendar events, validated into a plain dict."""
+    fileId: Required[Annotated[str, Field(description="Google Drive file ID")]]
+    fileUrl: Annotated[Optional[str], Field(description="File URL")]
+    title: Annotated[Optional[str], Field(description="File title")]
+    mimeType: Annotated[Optional[str], Field(description="File MIME type")]
 
-class Attachment(BaseModel):
-    """Attachment schema for Google Calendar events."""
-    fileId: str = Field(..., description="Google Drive file ID")
-    fileUrl: Optional[str] = Field(None, description="File URL")
-    title: Optional[str] = Field(None, description="File title")
-    mimeType: Optional[str] = Field(None, description="File MIME type")
 
+# The names these schemas had as models
+Attendee = AttendeeDict
+Attachment = AttachmentDict
 
-class ReminderOverride(BaseModel):
+
+class ReminderOverride(_Schema):
     """Reminder override schema."""
-    method: Literal["email", "popup"] = Field(..., description="Reminder method")
+    method: ReminderMethod = Field(..., description="Reminder method")
     minutes: int = Field(..., description="Minutes before event to remind")
 
 
-class Reminders(BaseModel):
+class Reminders(_Schema):
     """Reminders schema for Google Calendar events."""
     useDefault: Optional[bool] = Field(None, description="Use default reminders")
     overrides: Optional[List[ReminderOverride]] = Field(None, description="Custom reminder overrides")
 
 
-class ConferenceData(BaseModel):
+class ConferenceData(_Schema):
     """Conference data schema for Google Calendar events."""
     createRequest: Optional[dict] = Field(None, description="Conference creation request")
 
 
-class Event(BaseModel):
-    """Event schema for Google Calendar."""
-    summary: str = Field(..., description="Event title")
+class _EventFields(_Schema):
+    """Fields shared by events and event create/update requests."""
     description: Optional[str] = Field(None, description="Event description")
     location: Optional[str] = Field(None, description="Event location")
     colorId: Optional[str] = Field(None, description="Event color ID")
-    start: DateTime = Field(..., description="Event start time")
-    end: DateTime = Field(..., description="Event end time")
     recurrence: Optional[List[str]] = Field(None, description="Recurrence rules")
-    attendees: Optional[List[Attendee]] = Field(None, description="Event attendees")
-    attachments: Optional[List[Attachment]] = Field(None, max_length=25, description="Event attachments")
+    attendees: Optional[List[AttendeeDict]] = Field(None, description="Event attendees")
     reminders: Optional[Reminders] = Field(None, description="Event reminders")
-    visibility: Optional[Literal["default", "public", "private", "confidential"]] = Field(
+    visibility: Optional[Visibility] = Field(None, description="Event visibility")
+    transparency: Optional[Transparency] = Field(None, description="Event transparency")
+
+
+class _EventBody(_EventFields):
+    """Fields shared by full events and event creation requests."""
+    summary: str = Field(..., description="Event title")
+    attachments: Optional[List[AttachmentDict]] = Field(None, max_length=25, description="Event attachments")
+    visibility: Optional[Visibility] = Field(
         "default", description="Event visibility"
     )
-    transparency: Optional[Literal["opaque", "transparent"]] = Field(
+    transparency: Optional[Transparency] = Field(
         "opaque", description="Event transparency"
     )
     conferenceData: Optional[ConferenceData] = Field(None, description="Conference data")
 
 
-class CreateEventRequest(BaseModel):
+class Event(_EventBody):
+    """Event schema for Google Calendar."""
+    start: DateTime = Field(..., description="Event start time")
+    end: DateTime = Field(..., description="Event end time")
+
+
+class CreateEventRequest(_EventBody):
     """Create event request schema with all fields as top-level parameters."""
     calendarId: str = Field(..., description="Calendar ID or 'primary'")
-    summary: str = Field(..., description="Event title")
-    description: Optional[str] = Field(None, description="Event description")
-    location: Optional[str] = Field(None, description="Event location")
-    colorId: Optional[str] = Field(None, description="Event color ID")
     start_datetime: str = Field(..., description="Event start time")
     end_datetime: str = Field(..., description="Event end time")
     timezone: Optional[str] = Field(None, description="Timezone for the event")
-    recurrence: Optional[List[str]] = Field(None, description="Recurrence rules")
-    attendees: Optional[List[Attendee]] = Field(None, description="Event attendees")
-    attachments: Optional[List[Attachment]] = Field(None, max_length=25, description="Event attachments")
-    reminders: Optional[Reminders] = Field(None, description="Event reminders")
-    visibility: Optional[Literal["default", "public", "private", "confidential"]] = Field(
-        "default", description="Event visibility"
-    )
-    transparency: Optional[Literal["opaque", "transparent"]] = Field(
-        "opaque", description="Event transparency"
-    )
-    conferenceData: Optional[ConferenceData] = Field(None, description="Conference data")
 
 
-class ListEventsRequest(BaseModel):
+class ListEventsRequest(_Schema):
     """List events request schema."""
     calendarId: str = Field(..., description="Calendar ID")
     timeMin: Optional[str] = Field(None, description="Minimum time to list events from")
     timeMax: Optional[str] = Field(None, description="Maximum time to list events to")
-    maxResults: Optional[int] = Field(None, gt=0, description="Maximum number of events to return")
+    maxResults: Optional[int] = Field(None, gt=0, le=2500, description="Maximum number of events to return")
     singleEvents: Optional[bool] = Field(None, description="Expand recurring events")
-    orderBy: Optional[Literal["startTime", "updated"]] = Field(None, description="Order by field")
+    orderBy: Optional[OrderBy] = Field(None, description="Order by field")
+    fields: Optional[str] = Field(None, description="Partial response selector for the returned events")
+    pageToken: Optional[str] = Field(None, description="Token of the result page to return")
+
 
+class BatchListEventsRequest(_Schema):
+    """Batched list events request schema."""
+    items: List[ListEventsRequest] = Field(
+        ..., min_length=1, max_length=50, description="Event queries to run in one batch"
+    )
 
-class UpdateEventRequest(BaseModel):
+
+class UpdateEventRequest(_EventFields):
     """Update event request schema with all optional fields."""
     calendarId: str = Field(..., description="Calendar ID")
     eventId: str = Field(..., description="Event ID to update")
     summary: Optional[str] = Field(None, description="New event title")
-    description: Optional[str] = Field(None, description="New event description")
-    location: Optional[str] = Field(None, description="New event location")
-    colorId: Optional[str] = Field(None, description="Event color ID")
     start_datetime: Optional[str] = Field(None, description="New start time")
     end_datetime: Optional[str] = Field(None, description="New end time")
     timezone: Optional[str] = Field(None, description="Timezone for the event")
-    attendees: Optional[List[Attendee]] = Field(None, description="Event attendees")
-    recurrence: Optional[List[str]] = Field(None, description="Recurrence rules")
-    reminders: Optional[Reminders] = Field(None, description="Event reminders")
-    visibility: Optional[Literal["default", "public", "private", "confidential"]] = Field(
-        None, description="Event visibility"
-    )
-    transparency: Optional[Literal["opaque", "transparent"]] = Field(
-        None, description="Event transparency"
-    )
-    sendUpdates: Optional[Literal["all", "externalOnly", "none"]] = Field(
+    sendUpdates: Optional[SendUpdates] = Field(
         "all", description="Send updates to attendees"
     )
 
 
-class DeleteEventRequest(BaseModel):
+class DeleteEventRequest(_Schema):
     """Delete event request schema."""
     calendarId: str = Field(..., description="Calendar ID")
     eventId: str = Field(..., description="Event ID to delete")
-    sendUpdates: Optional[Literal["all", "externalOnly", "none"]] = Field(
+    sendUpdates: Optional[SendUpdates] = Field(
         "all", description="Send updates to attendees"
     )
 
 
-class FreeBusyItem(BaseModel):
+class FreeBusyItem(_Schema):
     """Free/busy calendar item schema."""
     id: str = Field(..., description="Calendar ID")
 
 
-class FreeBusyRequest(BaseModel):
+class FreeBusyRequest(_Schema):
     """Free/busy request schema."""
     timeMin: str = Field(..., description="Start time for free/busy query")
     timeMax: str = Field(..., description="End time for free/busy query")
@@ -1,93 +1,300 @@
 """Google Calendar MCP Server implementation."""
 
+import argparse
+import asyncio
 import json
+import os
+import re
 import sys
-import argparse
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-import pytz
+import threading
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import httplib2
+from google.auth.exceptions import RefreshError
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+
+try:
+    import orjson
+except ImportError:  # optional speedup; _dump falls back to the json module
+    orjson = None
 
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-from .auth import authorize
-from .tools import GOOGLE_CALENDAR_TOOLS
+from .auth import authorize_async, clear_cached_credentials
 from .schemas import (
+    BatchListEventsRequest,
     CreateEventRequest,
-    ListEventsRequest,
-    UpdateEventRequest,
     DeleteEventRequest,
     FreeBusyRequest,
+    ListEventsRequest,
+    UpdateEventRequest,
 )
+from .tools import get_google_calendar_tools, validate_tool_args
 from .utils import cool_log, logs
 
-
 # Create server instance
 server = Server("mcp-server-google-calendar")
 
 # Global variables for caching
-_user_timezone = None
+# The user's timezone as {"name", "zi", "last_offset", "offset_until", "template"},
+# where last_offset is a fixed-offset tzinfo valid until the offset_until time
+# and template holds the response fields that only change with the offset
+_user_timezone: Optional[Dict[str, Any]] = None
+_calendar_service = None
+_calendar_creds = None
+_calendar_http = None
 
+# Tool results are compact JSON; set MCP_DEBUG_JSON to get indented output
+_INDENT = 2 if os.environ.get("MCP_DEBUG_JSON") else None
 
-def get_user_timezone(calendar: Any) -> str:
-    """Get the user's timezone from Google Calendar settings with caching."""
+# Socket timeout for API connections, which are kept alive between requests
+_HTTP_TIMEOUT_SECONDS = 30
+
+# httplib2 connections are not thread-safe, so each worker thread that runs
+# API requests keeps its own AuthorizedHttp
+_thread_http = threading.local()
+
+_UTC = timezone.utc
+
+# How long a computed UTC offset of the user's timezone is reused
+_OFFSET_REUSE = timedelta(seconds=60)
+
+# Timezone-less shapes completed by validate_and_fix_datetime; anything else,
+# including RFC3339 with an offset, is passed through unchanged
+_NAIVE_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+_DATE_ONLY = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Google's free/busy endpoint accepts at most this many calendars per query
+_FREEBUSY_MAX_ITEMS = 50
+
+# Request fields copied verbatim into the event body on create/update
+_UPDATE_EVENT_FIELDS = (
+    "summary", "description", "location", "colorId", "visibility",
+    "transparency", "recurrence", "reminders", "attendees",
+)
+_CREATE_EVENT_FIELDS = _UPDATE_EVENT_FIELDS + ("attachments", "conferenceData")
+
+# Event fields returned by create-event and update-event
+_WRITTEN_EVENT_FIELDS = "id,htmlLink,summary,start,end"
+
+
+@lru_cache(maxsize=64)
+def _tz(name: str) -> ZoneInfo:
+    """Get a ZoneInfo object, loading each zone from disk only once."""
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=1024)
+def _offset_suffix(tz_name: str, date_string: str) -> Optional[str]:
+    """Get a zone's RFC3339 UTC offset suffix for a date.
+
+    Returns None when the offset changes during that day (a DST transition),
+    in which case the caller has to localize the full datetime.
+    """
+    day = date.fromisoformat(date_string)
+    start = datetime(day.year, day.month, day.day, tzinfo=_tz(tz_name))
+    end = start.replace(hour=23, minute=59, second=59)
+    if start.utcoffset() != end.utcoffset():
+        return None
+    return start.isoformat()[19:]
+
+
+@lru_cache(maxsize=256)
+def _transition_day_suffix(tz_name: str, dt_string: str) -> str:
+    """Get the UTC offset suffix for a naive datetime on a DST transition day.
+
+    A wall time that occurs twice or not at all gets the standard-time
+    offset, as pytz's localize() did by default (is_dst=False). For a
+    repeated hour that is the second occurrence (fold=1).
+    """
+    dt = datetime.fromisoformat(dt_string).replace(tzinfo=_tz(tz_name))
+    if dt.dst() and dt.replace(fold=1).utcoffset() != dt.utcoffset():
+        dt = dt.replace(fold=1)
+    return dt.isoformat()[19:]
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Serialize pydantic models nested in tool results."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(exclude_none=True)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump(obj: Any) -> str:
+    """Serialize a tool result as JSON text, indented only when debugging."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if _INDENT else None
+        return orjson.dumps(obj, default=_to_jsonable, option=option).decode()
+    if _INDENT:
+        return json.dumps(obj, indent=_INDENT, default=_to_jsonable)
+    return json.dumps(obj, separators=(",", ":"), default=_to_jsonable)
+
+
+def _fmt_validation(e: ValidationError) -> str:
+    """Summarize a validation error as "field: message" pairs."""
+    return "; ".join(f"{(err['loc'] or ('root',))[0]}: {err['msg']}" for err in e.errors())
+
+
+class _Calendar(NamedTuple):
+    """The Calendar API service with the resource collections the tools use.
+
+    googleapiclient builds a new resource object on every collection call,
+    so they are built once together with the service.
+    """
+    service: Any
+    events: Any
+    freebusy: Any
+    calendar_list: Any
+    settings: Any
+
+
+def _new_http(creds: Any) -> AuthorizedHttp:
+    """Create an authorized keep-alive connection for API requests."""
+    return AuthorizedHttp(creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT_SECONDS))
+
+
+def _get_calendar(creds: Any) -> _Calendar:
+    """Get the Calendar API service, building it only when credentials change."""
+    global _calendar_service, _calendar_creds, _calendar_http
+    if _calendar_service is None or creds is not _calendar_creds:
+        _calendar_http = _new_http(creds)
+        service = build(
+            "calendar", "v3", http=_calendar_http,
+            cache_discovery=False, static_discovery=True,
+        )
+        _calendar_service = _Calendar(
+            service=service,
+            events=service.events(),
+            freebusy=service.freebusy(),
+            calendar_list=service.calendarList(),
+            settings=service.settings(),
+        )
+        _calendar_creds = creds
+    return _calendar_service
+
+
+async def _calendar_for_request() -> _Calendar:
+    """Get the calendar service with credentials from authorize_async().
+
+    authorize_async() returns the shared credentials after a single clock
+    read until they enter the refresh-ahead window, where it starts the
+    background refresh; gating on creds.expired here would skip that window
+    and leave every request at the token boundary to refresh inline.
+    """
+    return _get_calendar(await authorize_async())
+
+
+def _reset_calendar() -> None:
+    """Forget the cached service and credentials so the next call re-authorizes."""
+    global _calendar_service, _calendar_creds, _calendar_http
+    _calendar_service = None
+    _calendar_creds = None
+    _calendar_http = None
+    clear_cached_credentials()
+
+
+def _http_for_thread(creds: Any) -> AuthorizedHttp:
+    """Get the calling thread's AuthorizedHttp for these credentials."""
+    http = getattr(_thread_http, "http", None)
+    if http is None or http.credentials is not creds:
+        http = _thread_http.http = _new_http(creds)
+    return http
+
+
+async def _execute(request: Any) -> Any:
+    """Run a blocking API request in a worker thread."""
+    creds = _calendar_creds
+    return await asyncio.to_thread(lambda: request.execute(http=_http_for_thread(creds)))
+
+
+def _set_user_timezone(name: str) -> None:
+    """Cache the user's timezone, with no offset computed yet."""
     global _user_timezone
-    
+    _user_timezone = {
+        "name": name, "zi": _tz(name), "last_offset": None, "offset_until": None, "template": None,
+    }
+
+
+async def get_user_timezone(calendar: _Calendar) -> str:
+    """Get the user's timezone from Google Calendar settings with caching."""
     # Return cached timezone if available
     if _user_timezone is not None:
-        return _user_timezone
+        return _user_timezone["name"]
     
     try:
         # Get timezone from Google Calendar settings
-        settings = calendar.settings().get(setting="timezone").execute()
-        _user_timezone = settings.get("value", "UTC")
+        settings = await _execute(calendar.settings.get(setting="timezone"))
+        _set_user_timezone(settings.get("value", "UTC"))
         
-        print(f"📍 Detected user timezone: {_user_timezone}", file=sys.stderr)
-        return _user_timezone
+        print(f"📍 Detected user timezone: {_user_timezone['name']}", file=sys.stderr)
+        return _user_timezone["name"]
         
     except Exception as e:
         print(f"⚠️ Could not get timezone from Google Calendar: {e}", file=sys.stderr)
         print("🕐 Falling back to UTC timezone", file=sys.stderr)
-        _user_timezone = "UTC"
-        return _user_timezone
+        _set_user_timezone("UTC")
+        return _user_timezone["name"]
+
+
+def _local_now() -> Tuple[datetime, datetime]:
+    """Get the current UTC time and the current time in the user's timezone.
+
+    Requires get_user_timezone() to have run. The zone's offset is reused for
+    up to _OFFSET_REUSE, unless a DST transition falls inside that window.
+    """
+    info = _user_timezone
+    now_utc = datetime.now(_UTC)
+    if info["offset_until"] is not None and now_utc < info["offset_until"]:
+        return now_utc, now_utc.astimezone(info["last_offset"])
+
+    now_local = now_utc.astimezone(info["zi"])
+    offset = now_local.utcoffset()
+    until = now_utc + _OFFSET_REUSE
+    info["last_offset"] = timezone(offset, now_local.tzname())
+    info["template"] = {
+        "timezone": info["name"],
+        "utc_offset": f"{now_local:%z}",
+        "timezone_name": now_local.tzname(),
+    }
+    info["offset_until"] = until if until.astimezone(info["zi"]).utcoffset() == offset else None
+    return now_utc, now_local
 
 
 def validate_and_fix_datetime(dt_string: Optional[str], default_timezone: str = "UTC") -> Optional[str]:
-    """Validate and fix datetime format to include timezone if missing."""
+    """Validate and fix datetime format to include timezone if missing.
+
+    Dates and datetimes are returned unchanged, with a warning, if
+    default_timezone is not a known zone.
+    """
     if not dt_string:
         return dt_string
     
     try:
-        # If it's already in RFC3339 format with timezone, return as is
-        if dt_string.endswith('Z') or '+' in dt_string[-6:] or dt_string.endswith('+00:00'):
+        # Each accepted shape has its own length, so at most one pattern is tried
+        n = len(dt_string)
+        if n == 10 and _DATE_ONLY.fullmatch(dt_string):
+            # Just a date (YYYY-MM-DD): add the start of the day
+            naive = dt_string + "T00:00:00"
+        elif n == 19 and _NAIVE_DATETIME.fullmatch(dt_string):
+            naive = dt_string
+        else:
+            # Already RFC3339 with a timezone, or a shape we leave as is
             return dt_string
-        
-        # If it's in YYYY-MM-DDTHH:MM:SS format, add timezone
-        if 'T' in dt_string and len(dt_string) == 19:
-            # Parse the datetime
-            dt = datetime.fromisoformat(dt_string)
-            
-            # Add timezone
-            tz = pytz.timezone(default_timezone)
-            dt_with_tz = tz.localize(dt)
-            
-            # Return in RFC3339 format
-            return dt_with_tz.isoformat()
-        
-        # If it's just a date (YYYY-MM-DD), add time and timezone
-        if len(dt_string) == 10 and '-' in dt_string:
-            dt_string += "T00:00:00"
-            dt = datetime.fromisoformat(dt_string)
-            tz = pytz.timezone(default_timezone)
-            dt_with_tz = tz.localize(dt)
-            return dt_with_tz.isoformat()
-        
-        return dt_string
+
+        # Append the zone's offset for that date; the strings are never parsed
+        # here, only inside the cached suffix helpers
+        suffix = _offset_suffix(default_timezone, naive[:10])
+        if suffix is None:
+            suffix = _transition_day_suffix(default_timezone, naive)
+        return naive + suffix
         
     except Exception as e:
         print(f"⚠️ Error fixing datetime format for '{dt_string}': {e}", file=sys.stderr)
@@ -95,371 +302,421 @@ def validate_and_fix_datetime(dt_string: Optional[str], default_timezone: str =
 
 
 async def check_time_slot_availability(
-    calendar: Any, calendar_id: str, start_time: str, end_time: str
+    calendar: _Calendar, calendar_ids: List[str], start_time: str, end_time: str
 ) -> bool:
-    """Check if a time slot is available (no overlapping events)."""
+    """Check if a time slot is available (no overlapping events) on all calendars.
+
+    The calendars are checked with a single free/busy query, so at most
+    _FREEBUSY_MAX_ITEMS can be passed.
+    """
     try:
-        res = calendar.freebusy().query(
+        res = await _execute(calendar.freebusy.query(
             body={
                 "timeMin": start_time,
                 "timeMax": end_time,
-                "items": [{"id": calendar_id}],
-            }
-        ).execute()
+                "items": [{"id": cid} for cid in calendar_ids],
+            },
+            fields="calendars",
+        ))
 
-        busy_slots = res.get("calendars", {}).get(calendar_id, {}).get("busy", [])
-        return len(busy_slots) == 0
+        calendars = res.get("calendars", {})
+        return not any(calendars.get(cid, {}).get("busy") for cid in calendar_ids)
     except Exception:
         # If we can't check availability, assume it's available
         return True
 
 
+async def freebusy_async(calendar: _Calendar, request_data: FreeBusyRequest) -> Dict[str, Any]:
+    """Query free/busy, splitting large calendar lists into concurrent queries."""
+    body = request_data.model_dump(exclude_none=True)
+    items = body.pop("items")
+    chunks = [
+        items[i:i + _FREEBUSY_MAX_ITEMS] for i in range(0, len(items), _FREEBUSY_MAX_ITEMS)
+    ] or [[]]
+
+    results = await asyncio.gather(*[
+        _execute(calendar.freebusy.query(body={**body, "items": chunk}))
+        for chunk in chunks
+    ])
+
+    merged = results[0]
+    for res in results[1:]:
+        merged.setdefault("calendars", {}).update(res.get("calendars", {}))
+        if "groups" in res:
+            merged.setdefault("groups", {}).update(res["groups"])
+    return merged
+
+
 @server.list_tools()
-async def handle_list_tools() -> List[types.Tool]:
+async def handle_list_tools() -> Sequence[types.Tool]:
     """List available tools."""
-    return GOOGLE_CALENDAR_TOOLS
+    return get_google_calendar_tools()
 
 
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: Optional[Dict[str, Any]]
+def _list_events_request(calendar: _Calendar, request_data: ListEventsRequest) -> Any:
+    """Build the events.list API request for a get-events query."""
+    return calendar.events.list(
+        calendarId=request_data.calendarId,
+        timeMin=request_data.timeMin,
+        timeMax=request_data.timeMax,
+        maxResults=request_data.maxResults,
+        singleEvents=request_data.singleEvents,
+        orderBy=request_data.orderBy,
+        fields=request_data.fields,
+        pageToken=request_data.pageToken,
+    )
+
+
+async def _handle_get_events(
+    calendar: _Calendar, request_data: ListEventsRequest
 ) -> List[types.TextContent]:
-    """Handle tool calls."""
-    if arguments is None:
-        arguments = {}
+    """List events from a calendar."""
+    # Call Google Calendar API
+    result = await _execute(_list_events_request(calendar, request_data))
+
+    return [
+        types.TextContent(
+            type="text",
+            text=_dump(result),
+        )
+    ]
+
+
+async def _handle_batch_get_events(
+    calendar: _Calendar, request_data: BatchListEventsRequest
+) -> List[types.TextContent]:
+    """Run several event queries as one multipart batch HTTP request."""
+    queries = request_data.items
+    results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+    def collect(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+        # A failed query reports its error without failing the others
+        index = int(request_id)
+        entry = {"calendarId": queries[index].calendarId}
+        if exception is not None:
+            entry["error"] = str(exception)
+        else:
+            entry.update(response)
+        results[index] = entry
+
+    batch = calendar.service.new_batch_http_request(callback=collect)
+    for index, query in enumerate(queries):
+        batch.add(_list_events_request(calendar, query), request_id=str(index))
+    await _execute(batch)
+
+    return [
+        types.TextContent(
+            type="text",
+            text=_dump(results),
+        )
+    ]
+
+
+async def _handle_list_calendars(
+    calendar: _Calendar, arguments: Dict[str, Any]
+) -> List[types.TextContent]:
+    """List the user's calendars."""
+    # List all calendars
+    result = await _execute(calendar.calendar_list.list())
+
+    return [
+        types.TextContent(
+            type="text",
+            text=_dump(result),
+        )
+    ]
 
-    # Authorize and build calendar service
-    creds = authorize()
-    calendar = build("calendar", "v3", credentials=creds)
 
+async def _handle_get_timezone_info(
+    calendar: _Calendar, arguments: Dict[str, Any]
+) -> List[types.TextContent]:
+    """Describe the user's timezone and current local time."""
+    # Get timezone information
     try:
-        if name == "get-events":
-            # Validate arguments
-            request_data = ListEventsRequest(**arguments)
-            
-            # Call Google Calendar API
-            result = calendar.events().list(
-                calendarId=request_data.calendarId,
-                timeMin=request_data.timeMin,
-                timeMax=request_data.timeMax,
-                maxResults=request_data.maxResults,
-                singleEvents=request_data.singleEvents,
-                orderBy=request_data.orderBy,
-            ).execute()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
-
-        elif name == "list-calendars":
-            # List all calendars
-            result = calendar.calendarList().list().execute()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
-
-        elif name == "get-timezone-info":
-            # Get timezone information
-            try:
-                user_tz = get_user_timezone(calendar)
-                
-                # Get current time in user's timezone
-                now_utc = datetime.now(pytz.UTC)
-                user_tz_obj = pytz.timezone(user_tz)
-                now_local = now_utc.astimezone(user_tz_obj)
-                
-                result = {
-                    "timezone": user_tz,
-                    "current_utc_time": now_utc.isoformat(),
-                    "current_local_time": now_local.isoformat(),
-                    "utc_offset": now_local.strftime("%z"),
-                    "timezone_name": now_local.tzname()
-                }
-                
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps({"error": f"Error getting timezone info: {str(e)}"}, indent=2),
-                    )
-                ]
+        await get_user_timezone(calendar)
 
-        elif name == "get-current-date":
-            # Get current date and time
-            try:
-                user_tz = get_user_timezone(calendar)
-                
-                # Get current time in user's timezone
-                now_utc = datetime.now(pytz.UTC)
-                user_tz_obj = pytz.timezone(user_tz)
-                now_local = now_utc.astimezone(user_tz_obj)
-                
-                result = {
-                    "current_date": now_local.strftime("%Y-%m-%d"),
-                    "current_time": now_local.strftime("%H:%M:%S"),
-                    "current_datetime": now_local.strftime("%Y-%m-%d %H:%M:%S"),
-                    "current_datetime_iso": now_local.isoformat(),
-                    "timezone": user_tz,
-                    "day_of_week": now_local.strftime("%A"),
-                    "formatted_date": now_local.strftime("%B %d, %Y"),
-                    "utc_datetime": now_utc.isoformat(),
-                    "timestamp": int(now_local.timestamp())
-                }
-                
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps({"error": f"Error getting current date: {str(e)}"}, indent=2),
-                    )
-                ]
+        # Get current time in user's timezone
+        now_utc, now_local = _local_now()
+
+        result = {
+            **_user_timezone["template"],
+            "current_utc_time": now_utc.isoformat(),
+            "current_local_time": now_local.isoformat(),
+        }
+
+        return [
+            types.TextContent(
+                type="text",
+                text=_dump(result),
+            )
+        ]
+    except Exception as e:
+        return [
+            types.TextContent(
+                type="text",
+                text=_dump({"error": f"Error getting timezone info: {str(e)}"}),
+            )
+        ]
+
+
+async def _handle_get_current_date(
+    calendar: _Calendar, arguments: Dict[str, Any]
+) -> List[types.TextContent]:
+    """Get the current date and time in the user's timezone."""
+    # Get current date and time
+    try:
+        user_tz = await get_user_timezone(calendar)
+
+        # Get current time in user's timezone
+        now_utc, now_local = _local_now()
+
+        # Slice the numeric fields out of one isoformat() string; only
+        # the day and month names need the formatter
+        iso = now_local.isoformat()
+        result = {
+            "current_date": iso[:10],
+            "current_time": iso[11:19],
+            "current_datetime": f"{iso[:10]} {iso[11:19]}",
+            "current_datetime_iso": iso,
+            "timezone": user_tz,
+            "day_of_week": f"{now_local:%A}",
+            "formatted_date": f"{now_local:%B} {iso[8:10]}, {iso[:4]}",
+            "utc_datetime": now_utc.isoformat(),
+            "timestamp": int(now_local.timestamp())
+        }
+
+        return [
+            types.TextContent(
+                type="text",
+                text=_dump(result),
+            )
+        ]
+    except Exception as e:
+        return [
+            types.TextContent(
+                type="text",
+                text=_dump({"error": f"Error getting current date: {str(e)}"}),
+            )
+        ]
+
+
+async def _handle_check_availability(
+    calendar: _Calendar, request_data: FreeBusyRequest
+) -> List[types.TextContent]:
+    """Query free/busy information for one or more calendars."""
+    # Call Google Calendar API
+    result = await freebusy_async(calendar, request_data)
+
+    return [
+        types.TextContent(
+            type="text",
+            text=_dump(result),
+        )
+    ]
 
-        elif name == "check-availability":
-            # Validate arguments
-            request_data = FreeBusyRequest(**arguments)
-            
-            # Call Google Calendar API
-            result = calendar.freebusy().query(
-                body=request_data.model_dump(exclude_none=True)
-            ).execute()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
-
-        elif name == "create-event":
-            # Validate arguments
-            request_data = CreateEventRequest(**arguments)
-            
-            # Use provided timezone or auto-detect from user's Google Calendar
-            user_tz = request_data.timezone or get_user_timezone(calendar)
-            
-            # Fix datetime formats to include proper timezone
+
+async def _handle_create_event(
+    calendar: _Calendar, request_data: CreateEventRequest
+) -> List[types.TextContent]:
+    """Create an event after checking the slot for conflicts."""
+    # Use provided timezone or auto-detect from user's Google Calendar
+    user_tz = request_data.timezone or await get_user_timezone(calendar)
+
+    # Fix datetime formats to include proper timezone
+    fixed_start = validate_and_fix_datetime(request_data.start_datetime, user_tz)
+    fixed_end = validate_and_fix_datetime(request_data.end_datetime, user_tz)
+
+    # Build event data from a single dump of the validated request
+    dumped = request_data.model_dump(exclude_none=True)
+    event_data = {k: dumped[k] for k in _CREATE_EVENT_FIELDS if k in dumped}
+    event_data["start"] = {"dateTime": fixed_start, "timeZone": user_tz}
+    event_data["end"] = {"dateTime": fixed_end, "timeZone": user_tz}
+
+    # Check availability before creating the event
+    is_available = await check_time_slot_availability(
+        calendar,
+        [request_data.calendarId],
+        event_data["start"]["dateTime"],
+        event_data["end"]["dateTime"],
+    )
+
+    if not is_available:
+        return [
+            types.TextContent(
+                type="text",
+                text=_dump({
+                    "error": "Time slot is not available - there are overlapping events",
+                    "status": "CONFLICT"
+                }),
+            )
+        ]
+
+    # Create the event
+    result = await _execute(calendar.events.insert(
+        calendarId=request_data.calendarId,
+        body=event_data,
+        conferenceDataVersion=1 if event_data.get("conferenceData") else 0,
+        supportsAttachments=bool(event_data.get("attachments")),
+        fields=_WRITTEN_EVENT_FIELDS,
+    ))
+
+    return [
+        types.TextContent(
+            type="text",
+            text=_dump({
+                "success": True,
+                "event": result,
+                "message": f"Event '{request_data.summary}' created successfully from {request_data.start_datetime} to {request_data.end_datetime} ({user_tz})",
+                "event_link": result.get("htmlLink"),
+                "event_id": result.get("id")
+            }),
+        )
+    ]
+
+
+async def _handle_delete_event(
+    calendar: _Calendar, request_data: DeleteEventRequest
+) -> List[types.TextContent]:
+    """Delete an event."""
+    # Delete the event
+    await _execute(calendar.events.delete(
+        calendarId=request_data.calendarId,
+        eventId=request_data.eventId,
+        sendUpdates=request_data.sendUpdates,
+    ))
+
+    return [
+        types.TextContent(
+            type="text",
+            text=_dump({
+                "success": True,
+                "message": f"Event {request_data.eventId} deleted successfully"
+            }),
+        )
+    ]
+
+
+async def _handle_update_event(
+    calendar: _Calendar, request_data: UpdateEventRequest
+) -> List[types.TextContent]:
+    """Patch an event, checking a new time slot for conflicts."""
+    # Build update data with only provided fields
+    dumped = request_data.model_dump(exclude_none=True)
+    update_data = {k: dumped[k] for k in _UPDATE_EVENT_FIELDS if k in dumped}
+
+    # Handle datetime updates
+    if request_data.start_datetime or request_data.end_datetime:
+        # Use provided timezone or auto-detect from user's Google Calendar
+        user_tz = request_data.timezone or await get_user_timezone(calendar)
+
+        if request_data.start_datetime:
             fixed_start = validate_and_fix_datetime(request_data.start_datetime, user_tz)
+            update_data["start"] = {
+                "dateTime": fixed_start,
+                "timeZone": user_tz
+            }
+
+        if request_data.end_datetime:
             fixed_end = validate_and_fix_datetime(request_data.end_datetime, user_tz)
-            
-            # Build event data
-            event_data = {
-                "summary": request_data.summary,
-                "start": {
-                    "dateTime": fixed_start,
-                    "timeZone": user_tz
-                },
-                "end": {
-                    "dateTime": fixed_end,
-                    "timeZone": user_tz
-                }
+            update_data["end"] = {
+                "dateTime": fixed_end,
+                "timeZone": user_tz
             }
-            
-            # Add optional fields
-            if request_data.description is not None:
-                event_data["description"] = request_data.description
-            if request_data.location is not None:
-                event_data["location"] = request_data.location
-            if request_data.colorId is not None:
-                event_data["colorId"] = request_data.colorId
-            if request_data.visibility is not None:
-                event_data["visibility"] = request_data.visibility
-            if request_data.transparency is not None:
-                event_data["transparency"] = request_data.transparency
-            if request_data.recurrence is not None:
-                event_data["recurrence"] = request_data.recurrence
-            if request_data.reminders is not None:
-                event_data["reminders"] = request_data.reminders.model_dump(exclude_none=True) if hasattr(request_data.reminders, 'model_dump') else request_data.reminders
-            if request_data.attendees is not None:
-                event_data["attendees"] = [attendee.model_dump(exclude_none=True) if hasattr(attendee, 'model_dump') else attendee for attendee in request_data.attendees]
-            if request_data.attachments is not None:
-                event_data["attachments"] = [attachment.model_dump(exclude_none=True) if hasattr(attachment, 'model_dump') else attachment for attachment in request_data.attachments]
-            if request_data.conferenceData is not None:
-                event_data["conferenceData"] = request_data.conferenceData
-            
-            # Check availability before creating the event
+
+        # If updating time, check for availability
+        if update_data.get("start") and update_data.get("end"):
             is_available = await check_time_slot_availability(
                 calendar,
-                request_data.calendarId,
-                event_data["start"]["dateTime"],
-                event_data["end"]["dateTime"],
+                [request_data.calendarId],
+                update_data["start"]["dateTime"],
+                update_data["end"]["dateTime"],
             )
 
             if not is_available:
                 return [
                     types.TextContent(
                         type="text",
-                        text=json.dumps({
-                            "error": "Time slot is not available - there are overlapping events",
+                        text=_dump({
+                            "error": "New time slot is not available - there are overlapping events",
                             "status": "CONFLICT"
-                        }, indent=2),
+                        }),
                     )
                 ]
-            
-            # Create the event
-            result = calendar.events().insert(
-                calendarId=request_data.calendarId,
-                body=event_data,
-                conferenceDataVersion=1 if event_data.get("conferenceData") else 0,
-                supportsAttachments=bool(event_data.get("attachments")),
-            ).execute()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": True,
-                        "event": result,
-                        "message": f"Event '{request_data.summary}' created successfully from {request_data.start_datetime} to {request_data.end_datetime} ({user_tz})",
-                        "event_link": result.get("htmlLink"),
-                        "event_id": result.get("id")
-                    }, indent=2),
-                )
-            ]
-
-        elif name == "delete-event":
-            # Validate arguments
-            request_data = DeleteEventRequest(**arguments)
-            
-            # Delete the event
-            calendar.events().delete(
-                calendarId=request_data.calendarId,
-                eventId=request_data.eventId,
-                sendUpdates=request_data.sendUpdates,
-            ).execute()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": True,
-                        "message": f"Event {request_data.eventId} deleted successfully"
-                    }, indent=2),
-                )
-            ]
-
-        elif name == "update-event":
-            # Validate arguments
-            request_data = UpdateEventRequest(**arguments)
-            
-            # Build update data with only provided fields
-            update_data = {}
-            
-            # Simple fields
-            if request_data.summary is not None:
-                update_data["summary"] = request_data.summary
-            if request_data.description is not None:
-                update_data["description"] = request_data.description
-            if request_data.location is not None:
-                update_data["location"] = request_data.location
-            if request_data.colorId is not None:
-                update_data["colorId"] = request_data.colorId
-            if request_data.visibility is not None:
-                update_data["visibility"] = request_data.visibility
-            if request_data.transparency is not None:
-                update_data["transparency"] = request_data.transparency
-            if request_data.recurrence is not None:
-                update_data["recurrence"] = request_data.recurrence
-            if request_data.reminders is not None:
-                update_data["reminders"] = request_data.reminders.model_dump(exclude_none=True) if hasattr(request_data.reminders, 'model_dump') else request_data.reminders
-            if request_data.attendees is not None:
-                update_data["attendees"] = [attendee.model_dump(exclude_none=True) if hasattr(attendee, 'model_dump') else attendee for attendee in request_data.attendees]
-                
-            # Handle datetime updates
-            if request_data.start_datetime or request_data.end_datetime:
-                # Use provided timezone or auto-detect from user's Google Calendar
-                user_tz = request_data.timezone or get_user_timezone(calendar)
-                
-                if request_data.start_datetime:
-                    fixed_start = validate_and_fix_datetime(request_data.start_datetime, user_tz)
-                    update_data["start"] = {
-                        "dateTime": fixed_start,
-                        "timeZone": user_tz
-                    }
-                    
-                if request_data.end_datetime:
-                    fixed_end = validate_and_fix_datetime(request_data.end_datetime, user_tz)
-                    update_data["end"] = {
-                        "dateTime": fixed_end,
-                        "timeZone": user_tz
-                    }
-                
-                # If updating time, check for availability
-                if update_data.get("start") and update_data.get("end"):
-                    is_available = await check_time_slot_availability(
-                        calendar,
-                        request_data.calendarId,
-                        update_data["start"]["dateTime"],
-                        update_data["end"]["dateTime"],
-                    )
 
-                    if not is_available:
-                        return [
-                            types.TextContent(
-                                type="text",
-                                text=json.dumps({
-                                    "error": "New time slot is not available - there are overlapping events",
-                                    "status": "CONFLICT"
-                                }, indent=2),
-                            )
-                        ]
-            
-            # If no fields to update, return error
-            if not update_data:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "error": "No fields provided to update. Please specify at least one field to update."
-                        }, indent=2),
-                    )
-                ]
+    # If no fields to update, return error
+    if not update_data:
+        return [
+            types.TextContent(
+                type="text",
+                text=_dump({
+                    "error": "No fields provided to update. Please specify at least one field to update."
+                }),
+            )
+        ]
+
+    # Update the event
+    result = await _execute(calendar.events.patch(
+        calendarId=request_data.calendarId,
+        eventId=request_data.eventId,
+        body=update_data,
+        sendUpdates=request_data.sendUpdates,
+        fields=_WRITTEN_EVENT_FIELDS,
+    ))
+
+    return [
+        types.TextContent(
+            type="text",
+            text=_dump({
+                "success": True,
+                "event": result,
+                "message": f"Event '{result.get('summary', request_data.eventId)}' updated successfully",
+                "updated_fields": list(update_data.keys()),
+                "event_link": result.get("htmlLink")
+            }),
+        )
+    ]
+
+
+# Tool name -> handler coroutine taking (calendar, validated arguments)
+_HANDLERS = {
+    "get-events": _handle_get_events,
+    "batch-get-events": _handle_batch_get_events,
+    "list-calendars": _handle_list_calendars,
+    "get-timezone-info": _handle_get_timezone_info,
+    "get-current-date": _handle_get_current_date,
+    "check-availability": _handle_check_availability,
+    "create-event": _handle_create_event,
+    "delete-event": _handle_delete_event,
+    "update-event": _handle_update_event,
+}
 
-            # Update the event
-            result = calendar.events().patch(
-                calendarId=request_data.calendarId,
-                eventId=request_data.eventId,
-                body=update_data,
-                sendUpdates=request_data.sendUpdates,
-            ).execute()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "success": True,
-                        "event": result,
-                        "message": f"Event '{result.get('summary', request_data.eventId)}' updated successfully",
-                        "updated_fields": list(update_data.keys()),
-                        "event_link": result.get("htmlLink")
-                    }, indent=2),
-                )
-            ]
 
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: Optional[Dict[str, Any]]
+) -> List[types.TextContent]:
+    """Handle tool calls."""
+    if arguments is None:
+        arguments = {}
 
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    # Reject invalid arguments before authorizing or calling the API
+    try:
+        request_data = validate_tool_args(name, arguments)
     except ValidationError as e:
-        error_msg = f"Invalid arguments: {'; '.join([f'{err['loc'][0] if err['loc'] else 'root'}: {err['msg']}' for err in e.errors()])}"
-        raise ValueError(error_msg)
+        raise ValueError(f"Invalid arguments: {_fmt_validation(e)}")
+
+    # Get the (cached) calendar service, authorizing only when needed
+    calendar = await _calendar_for_request()
+
+    try:
+        return await handler(calendar, request_data)
+    except RefreshError as e:
+        _reset_calendar()
+        raise RuntimeError(f"Error refreshing Google Calendar credentials: {str(e)}")
     except Exception as e:
         raise RuntimeError(f"Error calling Google Calendar API: {str(e)}")
 
@@ -482,7 +739,7 @@ async def main():
         # Authorize Google Calendar access
         print("Initializing Google Calendar authorization...", file=sys.stderr)
         try:
-            authorize()
+            await _calendar_for_request()
             print("Google Calendar authorization successful!", file=sys.stderr)
         except Exception as e:
             print(f"Error during Google Calendar authorization: {e}", file=sys.stderr)
@@ -1,27 +1,58 @@
 """Google Calendar MCP Server implementation with SSE support using FastMCP."""
 
+import argparse
+import asyncio
 import json
+import re
 import sys
-import argparse
-from typing import Optional
+import threading
+import time
 from datetime import datetime
-import re
+from enum import Enum
+from functools import lru_cache
+from typing import Annotated, List, Optional
+
+import httplib2
 import pytz
+import uvicorn
 from dateutil import tz
-
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from pydantic import ValidationError
-import uvicorn
+from pydantic import BaseModel, Field
+
+# uvicorn[standard] installs uvloop (not on Windows) and httptools; fall
+# back to the pure-Python implementations when they are unavailable
+try:
+    import uvloop  # noqa: F401
+    _UVICORN_LOOP = "uvloop"
+except ImportError:
+    _UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "h11"
+
+try:
+    import orjson
+except ImportError:  # optional speedup; _dumps falls back to the json module
+    orjson = None
 
 from mcp.server.fastmcp import FastMCP
 
-from .auth import authorize
+from .auth import authorize_cached
 from .schemas import (
-    CreateEventRequest,
+    AttachmentDict,
+    AttendeeDict,
+    ConferenceData,
+    FreeBusyItem,
     ListEventsRequest,
-    UpdateEventRequest,
-    DeleteEventRequest,
-    FreeBusyRequest,
+    OrderBy,
+    Reminders,
+    SendUpdates,
+    Transparency,
+    Visibility,
 )
 from .utils import cool_log, logs
 
@@ -30,40 +61,184 @@ mcp = FastMCP("Google Calendar MCP Server")
 
 # Global cache for calendar service and timezone
 _calendar_service = None
+_calendar_creds = None
 _user_timezone = None
+# pytz timezone for _user_timezone, cleared whenever it changes
+_default_tz_obj = None
+
+# Recent conflict checks keyed by (calendar_id, start, end) -> (monotonic time,
+# result), so an agent re-probing the same slot skips the free/busy round trip
+_fb_cache: dict[tuple, tuple[float, dict]] = {}
+_FB_TTL = 10.0
+_FB_CACHE_MAX = 256
+
+# Google's free/busy endpoint accepts at most this many calendars per query;
+# queued queries are also sent at most this many per batch request
+_FREEBUSY_MAX_ITEMS = 50
+# Seconds a queued free/busy query waits for its result before giving up
+_FB_WAIT_TIMEOUT = 60.0
+
+# Serialized results of read-only tools keyed by (tool name, *arguments) ->
+# (monotonic expiry, payload); events are dropped whenever an event changes
+_response_cache: dict[tuple, tuple[float, str]] = {}
+_RESPONSE_TTL = {"get_events": 10.0, "list_calendars": 300.0}
+_RESPONSE_CACHE_MAX = 256
+
+# Last get_timezone_info/get_current_date payload per tool as (epoch second,
+# timezone, payload); within one wall-clock second the answer cannot change
+_now_cache: dict[str, tuple[int, str, str]] = {}
+_UTC = pytz.UTC
+
+# Tools run API requests in worker threads; httplib2 connections are not
+# thread-safe, so each thread keeps its own AuthorizedHttp
+_thread_http = threading.local()
+_HTTP_TIMEOUT_SECONDS = 30
+
+# Timezone-less shapes completed by validate_and_fix_datetime
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DT_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$')
+_DT_MS_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+$')
+_BASIC_OFFSET_RE = re.compile(r'[+-]\d{4}$')
+
+
+def _dumps(obj) -> str:
+    """Serialize a tool result as indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _dumps_line(obj) -> str:
+    """Serialize one value as a single compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _ndjson_events(result: dict) -> str:
+    """Render an events list response as NDJSON.
+
+    The first line holds the response metadata (everything but "items"),
+    followed by one line per event, so a client can handle events one at a
+    time instead of parsing one large indented document.
+    """
+    events = result.pop("items", None) or ()
+    lines = [_dumps_line(result)]
+    lines.extend(map(_dumps_line, events))
+    return "\n".join(lines)
+
+
+def _drop_none(value):
+    """Recursively remove None values from dicts inside a tool argument."""
+    if isinstance(value, dict):
+        return {k: _drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_none(v) for v in value]
+    return value
+
+
+def _event_body(fields: dict) -> dict:
+    """Build an event body from the event fields a tool was given.
+
+    FastMCP has already validated the arguments against the schema types, so
+    nested models only need dumping and enums unwrapping to their values.
+    """
+    body = {}
+    for name, value in fields.items():
+        if value is None:
+            continue
+        if isinstance(value, BaseModel):
+            value = value.model_dump(exclude_none=True)
+        elif isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, list):
+            # TypedDict entries such as attendees keep explicit nulls
+            value = _drop_none(value)
+        body[name] = value
+    return body
+
+
+@lru_cache(maxsize=64)
+def _tz(name: str):
+    """Get a pytz timezone, looking each name up only once."""
+    return pytz.timezone(name)
+
+
+def _set_user_timezone(name: str) -> None:
+    """Cache the user's timezone name and drop the timezone object built for the old one."""
+    global _user_timezone, _default_tz_obj
+    _user_timezone = name
+    _default_tz_obj = None
+
+
+def _user_tz_obj():
+    """Get the pytz timezone for the user's timezone."""
+    global _default_tz_obj
+    if _default_tz_obj is not None:
+        return _default_tz_obj
+    tz_obj = _tz(get_user_timezone())
+    # Only keep it once the real timezone is known, not the startup UTC stand-in
+    if _user_timezone is not None:
+        _default_tz_obj = tz_obj
+    return tz_obj
+
 
 def get_calendar_service():
-    """Get authenticated Google Calendar service with caching."""
-    global _calendar_service
-    
-    # Return cached service if available
-    if _calendar_service is not None:
-        return _calendar_service
-    
-    # Authenticate and create new service (only once)
-    creds = authorize()
-    _calendar_service = build("calendar", "v3", credentials=creds)
-    return _calendar_service
+    """Get the Google Calendar service built by initialize_calendar_service.
+
+    main_sse builds the service before the server accepts requests, so tools
+    running concurrently never race to authorize and build it themselves.
+    """
+    service = _calendar_service
+    if service is None:
+        raise RuntimeError("Google Calendar service is not initialized")
+    return service
+
+
+def _new_http(creds) -> AuthorizedHttp:
+    """Create an authorized keep-alive connection for API requests."""
+    return AuthorizedHttp(creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT_SECONDS))
+
+
+def _http_for_thread() -> AuthorizedHttp:
+    """Get the calling thread's AuthorizedHttp for the service's credentials."""
+    creds = _calendar_creds
+    http = getattr(_thread_http, "http", None)
+    if http is None or http.credentials is not creds:
+        http = _thread_http.http = _new_http(creds)
+    return http
+
+
+async def _execute(request):
+    """Run a blocking API request in a worker thread so the event loop keeps serving."""
+    return await asyncio.to_thread(lambda: request.execute(http=_http_for_thread()))
 
 
 def initialize_calendar_service():
     """Initialize the calendar service and timezone at startup."""
-    global _calendar_service, _user_timezone
+    global _calendar_service, _calendar_creds
     try:
         print("🚀 Starting Google Calendar MCP Server with SSE transport...")
-        creds = authorize()
-        _calendar_service = build("calendar", "v3", credentials=creds)
+        creds = authorize_cached()
+        _calendar_service = build(
+            "calendar", "v3", http=_new_http(creds), cache_discovery=False, static_discovery=True
+        )
+        _calendar_creds = creds
         print("✅ Authentication successful!")
         
         # Initialize timezone
         try:
-            settings = _calendar_service.settings().get(setting="timezone").execute()
-            _user_timezone = settings.get("value", "UTC")
+            settings = _calendar_service.settings().get(setting="timezone").execute(
+                http=_http_for_thread()
+            )
+            _set_user_timezone(settings.get("value", "UTC"))
             print(f"📍 User timezone detected: {_user_timezone}")
         except Exception as e:
             print(f"⚠️ Could not get timezone from Google Calendar: {e}")
             print("🕐 Using UTC as default timezone")
-            _user_timezone = "UTC"
+            _set_user_timezone("UTC")
         
         return True
     except Exception as e:
@@ -71,55 +246,55 @@ def initialize_calendar_service():
         return False
 
 
-def validate_and_fix_datetime(dt_string: Optional[str], default_timezone: str = "UTC") -> Optional[str]:
+def validate_and_fix_datetime(dt_string: Optional[str], default_timezone: Optional[str] = None) -> Optional[str]:
     """Validate and fix datetime string to RFC3339 format with proper timezone.
     
     Args:
         dt_string: The datetime string to validate
-        default_timezone: Default timezone to use if none specified (Brazil time)
+        default_timezone: Timezone to use if none specified (defaults to the user's timezone)
     """
     if not dt_string:
         return dt_string
     
-    # If it already has timezone info, return as is
-    if dt_string.endswith('Z') or '+' in dt_string[-6:] or '-' in dt_string[-6:]:
+    # Each accepted shape has its own length, so at most one pattern is tried
+    n = len(dt_string)
+
+    # If it already has timezone info (Z or a +HH:MM/-HH:MM suffix), return as is
+    if n >= 20:
+        if dt_string[-1] == 'Z':
+            return dt_string
+        c = dt_string[-6]
+        if c == '+' or c == '-':
+            return dt_string
+        # A +HHMM/-HHMM offset (ISO 8601 basic form) is already qualified but
+        # not valid RFC3339, so only the colon is added
+        if n >= 24 and dt_string[10] == 'T' and _BASIC_OFFSET_RE.search(dt_string):
+            return dt_string[:-2] + ':' + dt_string[-2:]
+    
+    # If it's just a date (YYYY-MM-DD), localize midnight
+    if n == 10 and _DATE_RE.match(dt_string):
+        dt = datetime.fromisoformat(dt_string)
+    # If it's datetime without timezone (YYYY-MM-DDTHH:MM:SS)
+    elif n == 19 and _DT_RE.match(dt_string):
+        dt = datetime.fromisoformat(dt_string)
+    # If it's datetime with fractional seconds but no timezone, drop them
+    elif n > 20 and _DT_MS_RE.match(dt_string):
+        dt = datetime.fromisoformat(dt_string[:19])
+    else:
+        # Return as is if we can't parse it
         return dt_string
     
     # Get the default timezone
     try:
-        default_timezone = get_user_timezone()
-        tz_obj = pytz.timezone(default_timezone)
+        tz_obj = _tz(default_timezone) if default_timezone else _user_tz_obj()
     except:
-        tz_obj = pytz.timezone("UTC")  # Fallback to UTC
-    
-    # If it's just a date (YYYY-MM-DD), add time and timezone
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', dt_string):
-        dt = datetime.strptime(dt_string, "%Y-%m-%d")
-        dt = tz_obj.localize(dt)
-        return dt.isoformat()
-    
-    # If it's datetime without timezone (YYYY-MM-DDTHH:MM:SS)
-    if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$', dt_string):
-        dt = datetime.strptime(dt_string, "%Y-%m-%dT%H:%M:%S")
-        dt = tz_obj.localize(dt)
-        return dt.isoformat()
-    
-    # If it's datetime with milliseconds but no timezone
-    if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+$', dt_string):
-        # Remove milliseconds for parsing
-        dt_clean = re.sub(r'\.\d+$', '', dt_string)
-        dt = datetime.strptime(dt_clean, "%Y-%m-%dT%H:%M:%S")
-        dt = tz_obj.localize(dt)
-        return dt.isoformat()
+        tz_obj = _tz("UTC")  # Fallback to UTC
     
-    # Return as is if we can't parse it
-    return dt_string
+    return tz_obj.localize(dt).isoformat()
 
 
 def get_user_timezone() -> str:
     """Get the user's timezone from Google Calendar settings with caching."""
-    global _user_timezone
-    
     # Return cached timezone if available
     if _user_timezone is not None:
         return _user_timezone
@@ -131,8 +306,11 @@ def get_user_timezone() -> str:
             return "UTC"
         
         # Get timezone from Google Calendar settings
-        settings = _calendar_service.settings().get(setting="timezone").execute()
-        _user_timezone = settings.get("value", "UTC")
+        # May run on the event loop or in a worker thread
+        settings = _calendar_service.settings().get(setting="timezone").execute(
+            http=_http_for_thread()
+        )
+        _set_user_timezone(settings.get("value", "UTC"))
         
         print(f"📍 Detected user timezone: {_user_timezone}")
         return _user_timezone
@@ -140,10 +318,184 @@ def get_user_timezone() -> str:
     except Exception as e:
         print(f"⚠️ Could not get timezone from Google Calendar: {e}")
         print("🕐 Falling back to UTC timezone")
-        _user_timezone = "UTC"
+        _set_user_timezone("UTC")
         return _user_timezone
 
 
+class _FreeBusyBatcher:
+    """Coalesces concurrent free/busy queries into as few HTTP round trips as possible.
+
+    A query made while no other is in flight is sent right away. Queries that
+    arrive while one is in flight are queued and sent together by the next
+    caller in line, at most _FREEBUSY_MAX_ITEMS at a time. If they share a
+    time range they become one query per _FREEBUSY_MAX_ITEMS calendars;
+    otherwise they are packed into a single batch request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = []
+        self._busy = False
+
+    def query(self, body: dict) -> dict:
+        waiter = {"event": threading.Event(), "lead": False, "result": None, "error": None}
+        with self._lock:
+            self._pending.append((body, waiter))
+            if not self._busy:
+                self._busy = True
+                waiter["lead"] = True
+        # Woken either with a result or to send the next batch
+        if not waiter["lead"] and not waiter["event"].wait(_FB_WAIT_TIMEOUT):
+            with self._lock:
+                # The event may have been set just as the wait ran out
+                if not waiter["event"].is_set():
+                    self._pending = [p for p in self._pending if p[1] is not waiter]
+                    raise TimeoutError("Timed out waiting for a free/busy query")
+        if waiter["lead"]:
+            self._run()
+        if waiter["error"] is not None:
+            raise waiter["error"]
+        return waiter["result"]
+
+    def _run(self) -> None:
+        with self._lock:
+            batch = self._pending[:_FREEBUSY_MAX_ITEMS]
+            del self._pending[:_FREEBUSY_MAX_ITEMS]
+        error: BaseException = RuntimeError("Free/busy query was not sent")
+        try:
+            self._send(batch)
+        except Exception as e:
+            error = e
+        finally:
+            # Every caller in the batch is woken whatever happened, or it
+            # would wait out its timeout
+            for _, waiter in batch:
+                if waiter["result"] is None and waiter["error"] is None:
+                    waiter["error"] = error
+                waiter["lead"] = False
+                waiter["event"].set()
+            with self._lock:
+                if self._pending:
+                    # Hand the queued queries to the first caller waiting on them
+                    nxt = self._pending[0][1]
+                    nxt["lead"] = True
+                    nxt["event"].set()
+                else:
+                    self._busy = False
+
+    def _send(self, batch: list) -> None:
+        calendar = get_calendar_service()
+        if len(batch) == 1:
+            body, waiter = batch[0]
+            waiter["result"] = calendar.freebusy().query(body=body).execute(http=_http_for_thread())
+            return
+
+        ranges = {(body["timeMin"], body["timeMax"]) for body, _ in batch}
+        if len(ranges) == 1:
+            # Same window: one query over every requested calendar, split into
+            # as many queries as the per-query item limit requires
+            time_min, time_max = ranges.pop()
+            items = list({item["id"]: item for body, _ in batch for item in body["items"]}.values())
+            res = None
+            for i in range(0, len(items), _FREEBUSY_MAX_ITEMS):
+                part = calendar.freebusy().query(
+                    body={
+                        "timeMin": time_min,
+                        "timeMax": time_max,
+                        "items": items[i:i + _FREEBUSY_MAX_ITEMS],
+                    }
+                ).execute(http=_http_for_thread())
+                if res is None:
+                    res = part
+                else:
+                    res.setdefault("calendars", {}).update(part.get("calendars", {}))
+            for _, waiter in batch:
+                waiter["result"] = res
+            return
+
+        def callback(request_id, response, exception):
+            waiter = batch[int(request_id)][1]
+            waiter["result"], waiter["error"] = response, exception
+
+        http_batch = calendar.new_batch_http_request(callback=callback)
+        for i, (body, _) in enumerate(batch):
+            http_batch.add(calendar.freebusy().query(body=body), request_id=str(i))
+        http_batch.execute(http=_http_for_thread())
+
+
+_fb_batcher = _FreeBusyBatcher()
+
+
+def _invalidate_conflicts() -> None:
+    """Forget cached conflict checks after an event changed.
+
+    All calendars are dropped since 'primary' and the calendar's own ID
+    name the same calendar; a stale "no conflicts" could allow a double booking.
+    """
+    _fb_cache.clear()
+
+
+def _store_conflicts(key: tuple, result: dict) -> None:
+    """Cache a conflict check, evicting expired entries once the cache grows.
+
+    If every entry is still fresh the oldest ones go, so the cache never
+    holds more than _FB_CACHE_MAX checks.
+    """
+    now = time.monotonic()
+    # Re-inserted keys move to the end of the eviction order
+    _fb_cache.pop(key, None)
+    if len(_fb_cache) >= _FB_CACHE_MAX:
+        for old in [k for k, (ts, _) in list(_fb_cache.items()) if now - ts >= _FB_TTL]:
+            _fb_cache.pop(old, None)
+        while len(_fb_cache) >= _FB_CACHE_MAX:
+            _fb_cache.pop(next(iter(_fb_cache)), None)
+    _fb_cache[key] = (now, result)
+
+
+def _cached_response(key: tuple) -> Optional[str]:
+    """Get a still-fresh cached tool response."""
+    cached = _response_cache.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    return None
+
+
+def _store_response(key: tuple, payload: str) -> None:
+    """Cache a tool response for its tool's TTL, evicting expired entries once the cache grows.
+
+    If every entry is still fresh the oldest ones go, so the cache never
+    holds more than _RESPONSE_CACHE_MAX responses.
+    """
+    now = time.monotonic()
+    # Re-inserted keys move to the end of the eviction order
+    _response_cache.pop(key, None)
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+        for old in [k for k, (exp, _) in list(_response_cache.items()) if now >= exp]:
+            _response_cache.pop(old, None)
+        while len(_response_cache) >= _RESPONSE_CACHE_MAX:
+            _response_cache.pop(next(iter(_response_cache)), None)
+    _response_cache[key] = (now + _RESPONSE_TTL[key[0]], payload)
+
+
+def _invalidate_events() -> None:
+    """Forget cached event listings after an event changed.
+
+    All calendars are dropped since 'primary' and the calendar's own ID
+    name the same calendar.
+    """
+    for key in [key for key in list(_response_cache) if key[0] == "get_events"]:
+        _response_cache.pop(key, None)
+
+
+def _conflict_check_failed(e: Exception) -> dict:
+    """Build the conflict check result reported when the check itself fails."""
+    return {
+        "has_conflicts": False,  # Assume no conflicts if check fails
+        "conflicts": [],
+        "error": f"Could not check for conflicts: {str(e)}"
+    }
+
+
 def check_time_slot_conflicts(
     calendar_id: str, start_time: str, end_time: str
 ) -> dict:
@@ -157,69 +509,88 @@ def check_time_slot_conflicts(
         }
     """
     try:
-        # Use the existing check_availability function for consistency
-        calendar = get_calendar_service()
         user_tz = get_user_timezone()
         
         # Ensure times have proper timezone
         fixed_start = validate_and_fix_datetime(start_time, user_tz)
         fixed_end = validate_and_fix_datetime(end_time, user_tz)
+    except Exception as e:
+        return _conflict_check_failed(e)
+    return _check_fixed_time_slot_conflicts(calendar_id, fixed_start, fixed_end)
+
+
+def _check_fixed_time_slot_conflicts(
+    calendar_id: str, fixed_start: str, fixed_end: str
+) -> dict:
+    """check_time_slot_conflicts for times already normalized to RFC3339."""
+    try:
+        user_tz = get_user_timezone()
         
-        res = calendar.freebusy().query(
-            body={
-                "timeMin": fixed_start,
-                "timeMax": fixed_end,
-                "items": [{"id": calendar_id}],
-            }
-        ).execute()
+        key = (calendar_id, fixed_start, fixed_end)
+        cached = _fb_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _FB_TTL:
+            return cached[1]
+        
+        res = _fb_batcher.query({
+            "timeMin": fixed_start,
+            "timeMax": fixed_end,
+            "items": [{"id": calendar_id}],
+        })
 
         busy_slots = res.get("calendars", {}).get(calendar_id, {}).get("busy", [])
         
         # Format conflicts with proper timezone information
-        formatted_conflicts = []
-        for slot in busy_slots:
+        try:
+            user_tz_obj = _tz(user_tz)
+        except Exception:
+            user_tz_obj = None
+        # Without a usable timezone every slot falls back to its original format
+        formatted_conflicts = [] if user_tz_obj is not None else list(busy_slots)
+        # fromisoformat parses the trailing Z on Python 3.11+, so the API's
+        # strings go straight in without a replace() copy per slot
+        parse = datetime.fromisoformat
+        for slot in busy_slots if user_tz_obj is not None else ():
             # Convert UTC times to user's timezone for display
             try:
-                start_utc = datetime.fromisoformat(slot["start"].replace("Z", "+00:00"))
-                end_utc = datetime.fromisoformat(slot["end"].replace("Z", "+00:00"))
-                
-                user_tz_obj = pytz.timezone(user_tz)
-                start_local = start_utc.astimezone(user_tz_obj)
-                end_local = end_utc.astimezone(user_tz_obj)
+                start_local = parse(slot["start"]).astimezone(user_tz_obj)
+                end_local = parse(slot["end"]).astimezone(user_tz_obj)
+                start_iso = start_local.isoformat()
+                end_iso = end_local.isoformat()
                 
                 formatted_conflicts.append({
-                    "start": start_local.isoformat(),
-                    "end": end_local.isoformat(),
+                    "start": start_iso,
+                    "end": end_iso,
                     "timezone": user_tz,
-                    "start_display": start_local.strftime("%Y-%m-%d %H:%M"),
-                    "end_display": end_local.strftime("%Y-%m-%d %H:%M")
+                    # YYYY-MM-DD HH:MM, sliced from the ISO strings
+                    "start_display": f"{start_iso[:10]} {start_iso[11:16]}",
+                    "end_display": f"{end_iso[:10]} {end_iso[11:16]}"
                 })
             except:
                 # Fallback to original format if conversion fails
                 formatted_conflicts.append(slot)
         
-        return {
+        result = {
             "has_conflicts": len(busy_slots) > 0,
             "conflicts": formatted_conflicts,
             "error": None
         }
+        _store_conflicts(key, result)
+        return result
         
     except Exception as e:
-        return {
-            "has_conflicts": False,  # Assume no conflicts if check fails
-            "conflicts": [],
-            "error": f"Could not check for conflicts: {str(e)}"
-        }
+        return _conflict_check_failed(e)
 
 
 @mcp.tool()
-def get_events(
+async def get_events(
     calendarId: str = "primary",
     timeMin: Optional[str] = None,
     timeMax: Optional[str] = None,
-    maxResults: int = 10,
+    maxResults: Annotated[int, Field(gt=0, le=2500)] = 10,
     singleEvents: bool = True,
-    orderBy: str = "startTime"
+    orderBy: OrderBy = OrderBy.startTime,
+    pageToken: Optional[str] = None,
+    ndjson: bool = False
 ) -> str:
     """Get events from Google Calendar.
     
@@ -229,85 +600,142 @@ def get_events(
                 Format: RFC3339 timestamp (e.g., '2023-10-02T00:00:00Z' or '2023-10-02')
         timeMax: Upper bound (exclusive) for an event's start time to filter by. Optional.
                 Format: RFC3339 timestamp (e.g., '2023-10-08T23:59:59Z' or '2023-10-08')
-        maxResults: Maximum number of events returned (1-2500, default: 10)
+        maxResults: Maximum number of events returned per page (1-2500, default: 10; keep to 20 or less and page with pageToken)
         singleEvents: Whether to expand recurring events into instances (default: True)
         orderBy: Order of events returned ('startTime' or 'updated', default: 'startTime')
+        pageToken: Token of the result page to return, from a previous call's nextPageToken (optional)
+        ndjson: Return NDJSON instead of JSON: a line of response metadata
+                (nextPageToken, timeZone, ...) followed by one line per event (default: False)
+
+    Returns:
+        JSON response with the events list, or NDJSON when ndjson is set
     """
     try:
         # Fix datetime formats to include timezone
         user_tz = get_user_timezone()
         fixed_timeMin = validate_and_fix_datetime(timeMin, user_tz)
         fixed_timeMax = validate_and_fix_datetime(timeMax, user_tz)
+
+        key = ("get_events", calendarId, fixed_timeMin, fixed_timeMax, maxResults, singleEvents, orderBy.value, pageToken, ndjson)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
         
-        # Validate arguments
-        request_data = ListEventsRequest(
+        # Get calendar service
+        calendar = get_calendar_service()
+        
+        # Call Google Calendar API
+        result = await _execute(calendar.events().list(
             calendarId=calendarId,
             timeMin=fixed_timeMin,
             timeMax=fixed_timeMax,
             maxResults=maxResults,
             singleEvents=singleEvents,
-            orderBy=orderBy
-        )
+            orderBy=orderBy.value,
+            pageToken=pageToken,
+        ))
+
+        payload = _ndjson_events(result) if ndjson else _dumps(result)
+        _store_response(key, payload)
+        return payload
         
-        # Get calendar service
+    except Exception as e:
+        return _dumps({"error": f"Error calling Google Calendar API: {str(e)}"})
+
+
+@mcp.tool()
+async def batch_get_events(
+    items: Annotated[List[ListEventsRequest], Field(min_length=1, max_length=50)]
+) -> str:
+    """Get events from several calendars or time ranges in a single batched request.
+    
+    Args:
+        items: get_events queries (calendarId, timeMin, timeMax, maxResults, singleEvents,
+               orderBy); results are returned in the same order, each with its calendarId
+    """
+    try:
+        user_tz = get_user_timezone()
         calendar = get_calendar_service()
-        
-        # Call Google Calendar API
-        result = calendar.events().list(
-            calendarId=request_data.calendarId,
-            timeMin=request_data.timeMin,
-            timeMax=request_data.timeMax,
-            maxResults=request_data.maxResults,
-            singleEvents=request_data.singleEvents,
-            orderBy=request_data.orderBy,
-        ).execute()
-
-        return json.dumps(result, indent=2)
-        
-    except ValidationError as e:
-        error_msg = f"Invalid arguments: {'; '.join([f'{err['loc'][0] if err['loc'] else 'root'}: {err['msg']}' for err in e.errors()])}"
-        return json.dumps({"error": error_msg}, indent=2)
+        results = [None] * len(items)
+
+        def collect(request_id, response, exception):
+            # A failed query reports its error without failing the others
+            index = int(request_id)
+            entry = {"calendarId": items[index].calendarId}
+            if exception is not None:
+                entry["error"] = str(exception)
+            else:
+                entry.update(response)
+            results[index] = entry
+
+        # All queries go out as one multipart request to the batch endpoint
+        batch = calendar.new_batch_http_request(callback=collect)
+        for index, query in enumerate(items):
+            batch.add(calendar.events().list(
+                calendarId=query.calendarId,
+                timeMin=validate_and_fix_datetime(query.timeMin, user_tz),
+                timeMax=validate_and_fix_datetime(query.timeMax, user_tz),
+                maxResults=query.maxResults or 10,
+                singleEvents=True if query.singleEvents is None else query.singleEvents,
+                orderBy=query.orderBy or "startTime",
+                fields=query.fields,
+                pageToken=query.pageToken,
+            ), request_id=str(index))
+        await _execute(batch)
+
+        return _dumps(results)
+
     except Exception as e:
-        return json.dumps({"error": f"Error calling Google Calendar API: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error calling Google Calendar API: {str(e)}"})
 
 
 @mcp.tool()
-def list_calendars() -> str:
+async def list_calendars() -> str:
     """List all available calendars."""
     try:
+        cached = _cached_response(("list_calendars",))
+        if cached is not None:
+            return cached
         calendar = get_calendar_service()
-        result = calendar.calendarList().list().execute()
-        return json.dumps(result, indent=2)
+        result = await _execute(calendar.calendarList().list())
+        payload = _dumps(result)
+        _store_response(("list_calendars",), payload)
+        return payload
     except Exception as e:
-        return json.dumps({"error": f"Error listing calendars: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error listing calendars: {str(e)}"})
 
 
 @mcp.tool()
-def get_timezone_info() -> str:
+async def get_timezone_info() -> str:
     """Get the current timezone information from Google Calendar."""
     try:
         user_tz = get_user_timezone()
+        t = time.time()
+        cached = _now_cache.get("timezone_info")
+        if cached is not None and cached[0] == int(t) and cached[1] == user_tz:
+            return cached[2]
         
         # Get current time in user's timezone
-        import datetime
-        now_utc = datetime.datetime.now(pytz.UTC)
-        user_tz_obj = pytz.timezone(user_tz)
+        now_utc = datetime.fromtimestamp(t, _UTC)
+        user_tz_obj = _tz(user_tz)
         now_local = now_utc.astimezone(user_tz_obj)
         
-        return json.dumps({
+        payload = _dumps({
             "timezone": user_tz,
             "current_utc_time": now_utc.isoformat(),
             "current_local_time": now_local.isoformat(),
             "utc_offset": now_local.strftime("%z"),
             "timezone_name": now_local.tzname()
-        }, indent=2)
+        })
+        _now_cache["timezone_info"] = (int(t), user_tz, payload)
+        return payload
         
     except Exception as e:
-        return json.dumps({"error": f"Error getting timezone info: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error getting timezone info: {str(e)}"})
 
 
 @mcp.tool()
-def get_current_date() -> str:
+async def get_current_date() -> str:
     """Get the current date and time in the user's timezone.
     
     This tool is especially useful for AI models that may have outdated knowledge
@@ -319,13 +747,17 @@ def get_current_date() -> str:
     """
     try:
         user_tz = get_user_timezone()
+        t = time.time()
+        cached = _now_cache.get("current_date")
+        if cached is not None and cached[0] == int(t) and cached[1] == user_tz:
+            return cached[2]
         
         # Get current time in user's timezone
-        now_utc = datetime.now(pytz.UTC)
-        user_tz_obj = pytz.timezone(user_tz)
+        now_utc = datetime.fromtimestamp(t, _UTC)
+        user_tz_obj = _tz(user_tz)
         now_local = now_utc.astimezone(user_tz_obj)
         
-        return json.dumps({
+        payload = _dumps({
             "current_date": now_local.strftime("%Y-%m-%d"),
             "current_time": now_local.strftime("%H:%M:%S"),
             "current_datetime": now_local.strftime("%Y-%m-%d %H:%M:%S"),
@@ -335,17 +767,19 @@ def get_current_date() -> str:
             "formatted_date": now_local.strftime("%B %d, %Y"),
             "utc_datetime": now_utc.isoformat(),
             "timestamp": int(now_local.timestamp())
-        }, indent=2)
+        })
+        _now_cache["current_date"] = (int(t), user_tz, payload)
+        return payload
         
     except Exception as e:
-        return json.dumps({"error": f"Error getting current date: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error getting current date: {str(e)}"})
 
 
 @mcp.tool()
-def check_availability(
+async def check_availability(
     timeMin: str,
     timeMax: str,
-    items: list
+    items: List[FreeBusyItem]
 ) -> str:
     """Check availability for specified calendars and time range.
     
@@ -360,31 +794,24 @@ def check_availability(
         fixed_timeMin = validate_and_fix_datetime(timeMin, user_tz)
         fixed_timeMax = validate_and_fix_datetime(timeMax, user_tz)
         
-        # Validate arguments
-        request_data = FreeBusyRequest(
-            timeMin=fixed_timeMin,
-            timeMax=fixed_timeMax,
-            items=items
-        )
-        
         calendar = get_calendar_service()
         
         # Call Google Calendar API
-        result = calendar.freebusy().query(
-            body=request_data.model_dump(exclude_none=True)
-        ).execute()
+        result = await _execute(calendar.freebusy().query(body={
+            "timeMin": fixed_timeMin,
+            "timeMax": fixed_timeMax,
+            "timeZone": "UTC",
+            "items": [{"id": item.id} for item in items],
+        }))
 
-        return json.dumps(result, indent=2)
+        return _dumps(result)
         
-    except ValidationError as e:
-        error_msg = f"Invalid arguments: {'; '.join([f'{err['loc'][0] if err['loc'] else 'root'}: {err['msg']}' for err in e.errors()])}"
-        return json.dumps({"error": error_msg}, indent=2)
     except Exception as e:
-        return json.dumps({"error": f"Error checking availability: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error checking availability: {str(e)}"})
 
 
 @mcp.tool()
-def create_event(
+async def create_event(
     calendarId: str,
     summary: str,
     start_datetime: str,
@@ -393,13 +820,13 @@ def create_event(
     location: Optional[str] = None,
     colorId: Optional[str] = None,
     timezone: Optional[str] = None,
-    recurrence: Optional[list] = None,
-    attendees: Optional[list] = None,
-    attachments: Optional[list] = None,
-    reminders: Optional[dict] = None,
-    visibility: Optional[str] = None,
-    transparency: Optional[str] = None,
-    conferenceData: Optional[dict] = None
+    recurrence: Optional[List[str]] = None,
+    attendees: Optional[List[AttendeeDict]] = None,
+    attachments: Optional[Annotated[List[AttachmentDict], Field(max_length=25)]] = None,
+    reminders: Optional[Reminders] = None,
+    visibility: Optional[Visibility] = None,
+    transparency: Optional[Transparency] = None,
+    conferenceData: Optional[ConferenceData] = None
 ) -> str:
     """Create an event in Google Calendar with support for all features.
     
@@ -427,146 +854,102 @@ def create_event(
         JSON response with full event details or error message
     """
     try:
-        # Validate arguments
-        request_data = CreateEventRequest(
-            calendarId=calendarId,
-            summary=summary,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            description=description,
-            location=location,
-            colorId=colorId,
-            timezone=timezone,
-            recurrence=recurrence,
-            attendees=attendees,
-            attachments=attachments,
-            reminders=reminders,
-            visibility=visibility,
-            transparency=transparency,
-            conferenceData=conferenceData
-        )
-        
         calendar = get_calendar_service()
         
         # Use provided timezone or auto-detect from user's Google Calendar
-        user_tz = request_data.timezone or get_user_timezone()
+        user_tz = timezone or get_user_timezone()
         
         # Fix datetime formats to include proper timezone
-        fixed_start = validate_and_fix_datetime(request_data.start_datetime, user_tz)
-        fixed_end = validate_and_fix_datetime(request_data.end_datetime, user_tz)
+        fixed_start = validate_and_fix_datetime(start_datetime, user_tz)
+        fixed_end = validate_and_fix_datetime(end_datetime, user_tz)
         
         # Check for conflicts before creating the event
-        conflict_check = check_time_slot_conflicts(
-            request_data.calendarId,
+        conflict_check = await asyncio.to_thread(
+            _check_fixed_time_slot_conflicts,
+            calendarId,
             fixed_start,
             fixed_end,
         )
 
         if conflict_check["has_conflicts"]:
-            return json.dumps({
+            return _dumps({
                 "error": "Time slot is not available - there are overlapping events",
                 "status": "CONFLICT",
                 "conflicting_events": conflict_check["conflicts"],
                 "conflict_check_error": conflict_check["error"]
-            }, indent=2)
-
-        # Build event data
-        event_data = {
-            "summary": request_data.summary,
-            "start": {
-                "dateTime": fixed_start,
-                "timeZone": user_tz
-            },
-            "end": {
-                "dateTime": fixed_end,
-                "timeZone": user_tz
-            }
-        }
-        
-        # Add optional fields
-        if request_data.description is not None:
-            event_data["description"] = request_data.description
-        if request_data.location is not None:
-            event_data["location"] = request_data.location
-        if request_data.colorId is not None:
-            event_data["colorId"] = request_data.colorId
-        if request_data.visibility is not None:
-            event_data["visibility"] = request_data.visibility
-        if request_data.transparency is not None:
-            event_data["transparency"] = request_data.transparency
-        if request_data.recurrence is not None:
-            event_data["recurrence"] = request_data.recurrence
-        if request_data.reminders is not None:
-            event_data["reminders"] = request_data.reminders.model_dump(exclude_none=True) if hasattr(request_data.reminders, 'model_dump') else request_data.reminders
-        if request_data.attendees is not None:
-            event_data["attendees"] = [attendee.model_dump(exclude_none=True) if hasattr(attendee, 'model_dump') else attendee for attendee in request_data.attendees]
-        if request_data.attachments is not None:
-            event_data["attachments"] = [attachment.model_dump(exclude_none=True) if hasattr(attachment, 'model_dump') else attachment for attachment in request_data.attachments]
-        if request_data.conferenceData is not None:
-            event_data["conferenceData"] = request_data.conferenceData
+            })
+
+        event_data = _event_body({
+            "summary": summary,
+            "description": description,
+            "location": location,
+            "colorId": colorId,
+            "visibility": visibility,
+            "transparency": transparency,
+            "recurrence": recurrence,
+            "reminders": reminders,
+            "attendees": attendees,
+            "attachments": attachments,
+            "conferenceData": conferenceData,
+        })
+        event_data["start"] = {"dateTime": fixed_start, "timeZone": user_tz}
+        event_data["end"] = {"dateTime": fixed_end, "timeZone": user_tz}
         
         # Create the event
-        result = calendar.events().insert(
-            calendarId=request_data.calendarId,
+        result = await _execute(calendar.events().insert(
+            calendarId=calendarId,
             body=event_data,
             conferenceDataVersion=1 if event_data.get("conferenceData") else 0,
             supportsAttachments=bool(event_data.get("attachments")),
-        ).execute()
+        ))
+
+        _invalidate_conflicts()
+        _invalidate_events()
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "event": result,
             "message": f"Event '{summary}' created successfully from {start_datetime} to {end_datetime} ({user_tz})",
             "event_link": result.get("htmlLink"),
             "event_id": result.get("id")
-        }, indent=2)
+        })
         
-    except ValidationError as e:
-        error_msg = f"Invalid arguments: {'; '.join([f'{err['loc'][0] if err['loc'] else 'root'}: {err['msg']}' for err in e.errors()])}"
-        return json.dumps({"error": error_msg}, indent=2)
     except Exception as e:
-        return json.dumps({"error": f"Error creating event: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error creating event: {str(e)}"})
 
 
 
 @mcp.tool()
-def delete_event(
+async def delete_event(
     calendarId: str,
     eventId: str,
-    sendUpdates: str = "all"
+    sendUpdates: SendUpdates = SendUpdates.all
 ) -> str:
     """Delete an event from Google Calendar."""
     try:
-        # Validate arguments
-        request_data = DeleteEventRequest(
-            calendarId=calendarId,
-            eventId=eventId,
-            sendUpdates=sendUpdates
-        )
-        
         calendar = get_calendar_service()
         
         # Delete the event
-        calendar.events().delete(
-            calendarId=request_data.calendarId,
-            eventId=request_data.eventId,
-            sendUpdates=request_data.sendUpdates,
-        ).execute()
+        await _execute(calendar.events().delete(
+            calendarId=calendarId,
+            eventId=eventId,
+            sendUpdates=sendUpdates.value,
+        ))
+
+        _invalidate_conflicts()
+        _invalidate_events()
 
-        return json.dumps({
+        return _dumps({
             "success": True,
-            "message": f"Event {request_data.eventId} deleted successfully"
-        }, indent=2)
+            "message": f"Event {eventId} deleted successfully"
+        })
         
-    except ValidationError as e:
-        error_msg = f"Invalid arguments: {'; '.join([f'{err['loc'][0] if err['loc'] else 'root'}: {err['msg']}' for err in e.errors()])}"
-        return json.dumps({"error": error_msg}, indent=2)
     except Exception as e:
-        return json.dumps({"error": f"Error deleting event: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error deleting event: {str(e)}"})
 
 
 @mcp.tool()
-def update_event(
+async def update_event(
     calendarId: str,
     eventId: str,
     summary: Optional[str] = None,
@@ -576,12 +959,12 @@ def update_event(
     start_datetime: Optional[str] = None,
     end_datetime: Optional[str] = None,
     timezone: Optional[str] = None,
-    attendees: Optional[list] = None,
-    recurrence: Optional[list] = None,
-    reminders: Optional[dict] = None,
-    visibility: Optional[str] = None,
-    transparency: Optional[str] = None,
-    sendUpdates: str = "all"
+    attendees: Optional[List[AttendeeDict]] = None,
+    recurrence: Optional[List[str]] = None,
+    reminders: Optional[Reminders] = None,
+    visibility: Optional[Visibility] = None,
+    transparency: Optional[Transparency] = None,
+    sendUpdates: SendUpdates = SendUpdates.all
 ) -> str:
     """Update an existing event in Google Calendar.
     
@@ -610,64 +993,35 @@ def update_event(
         JSON response with updated event details or error message
     """
     try:
-        # Validate arguments
-        request_data = UpdateEventRequest(
-            calendarId=calendarId,
-            eventId=eventId,
-            summary=summary,
-            description=description,
-            location=location,
-            colorId=colorId,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            timezone=timezone,
-            attendees=attendees,
-            recurrence=recurrence,
-            reminders=reminders,
-            visibility=visibility,
-            transparency=transparency,
-            sendUpdates=sendUpdates
-        )
-        
         calendar = get_calendar_service()
         
         # Build update data with only provided fields
-        update_data = {}
-        
-        # Simple fields
-        if request_data.summary is not None:
-            update_data["summary"] = request_data.summary
-        if request_data.description is not None:
-            update_data["description"] = request_data.description
-        if request_data.location is not None:
-            update_data["location"] = request_data.location
-        if request_data.colorId is not None:
-            update_data["colorId"] = request_data.colorId
-        if request_data.visibility is not None:
-            update_data["visibility"] = request_data.visibility
-        if request_data.transparency is not None:
-            update_data["transparency"] = request_data.transparency
-        if request_data.recurrence is not None:
-            update_data["recurrence"] = request_data.recurrence
-        if request_data.reminders is not None:
-            update_data["reminders"] = request_data.reminders.model_dump(exclude_none=True) if hasattr(request_data.reminders, 'model_dump') else request_data.reminders
-        if request_data.attendees is not None:
-            update_data["attendees"] = [attendee.model_dump(exclude_none=True) if hasattr(attendee, 'model_dump') else attendee for attendee in request_data.attendees]
+        update_data = _event_body({
+            "summary": summary,
+            "description": description,
+            "location": location,
+            "colorId": colorId,
+            "visibility": visibility,
+            "transparency": transparency,
+            "recurrence": recurrence,
+            "reminders": reminders,
+            "attendees": attendees,
+        })
             
         # Handle datetime updates
-        if request_data.start_datetime or request_data.end_datetime:
+        if start_datetime or end_datetime:
             # Use provided timezone or auto-detect from user's Google Calendar
-            user_tz = request_data.timezone or get_user_timezone()
+            user_tz = timezone or get_user_timezone()
             
-            if request_data.start_datetime:
-                fixed_start = validate_and_fix_datetime(request_data.start_datetime, user_tz)
+            if start_datetime:
+                fixed_start = validate_and_fix_datetime(start_datetime, user_tz)
                 update_data["start"] = {
                     "dateTime": fixed_start,
                     "timeZone": user_tz
                 }
                 
-            if request_data.end_datetime:
-                fixed_end = validate_and_fix_datetime(request_data.end_datetime, user_tz)
+            if end_datetime:
+                fixed_end = validate_and_fix_datetime(end_datetime, user_tz)
                 update_data["end"] = {
                     "dateTime": fixed_end,
                     "timeZone": user_tz
@@ -675,47 +1029,48 @@ def update_event(
             
             # If updating time, check for conflicts
             if update_data.get("start") and update_data.get("end"):
-                conflict_check = check_time_slot_conflicts(
-                    request_data.calendarId,
+                conflict_check = await asyncio.to_thread(
+                    _check_fixed_time_slot_conflicts,
+                    calendarId,
                     update_data["start"]["dateTime"],
                     update_data["end"]["dateTime"],
                 )
 
                 if conflict_check["has_conflicts"]:
-                    return json.dumps({
+                    return _dumps({
                         "error": "New time slot is not available - there are overlapping events",
                         "status": "CONFLICT",
                         "conflicting_events": conflict_check["conflicts"],
                         "conflict_check_error": conflict_check["error"]
-                    }, indent=2)
+                    })
         
         # If no fields to update, return error
         if not update_data:
-            return json.dumps({
+            return _dumps({
                 "error": "No fields provided to update. Please specify at least one field to update."
-            }, indent=2)
+            })
 
         # Update the event
-        result = calendar.events().patch(
-            calendarId=request_data.calendarId,
-            eventId=request_data.eventId,
+        result = await _execute(calendar.events().patch(
+            calendarId=calendarId,
+            eventId=eventId,
             body=update_data,
-            sendUpdates=request_data.sendUpdates,
-        ).execute()
+            sendUpdates=sendUpdates.value,
+        ))
+
+        _invalidate_conflicts()
+        _invalidate_events()
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "event": result,
             "message": f"Event '{result.get('summary', eventId)}' updated successfully",
             "updated_fields": list(update_data.keys()),
             "event_link": result.get("htmlLink")
-        }, indent=2)
+        })
         
-    except ValidationError as e:
-        error_msg = f"Invalid arguments: {'; '.join([f'{err['loc'][0] if err['loc'] else 'root'}: {err['msg']}' for err in e.errors()])}"
-        return json.dumps({"error": error_msg}, indent=2)
     except Exception as e:
-        return json.dumps({"error": f"Error updating event: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Error updating event: {str(e)}"})
 
 
 
@@ -727,6 +1082,7 @@ def main_sse():
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--log-level", default="info", help="Log level")
+    parser.add_argument("--access-log", action="store_true", help="Log every HTTP request")
     args = parser.parse_args()
 
     # Initialize Google Calendar service
@@ -745,7 +1101,11 @@ def main_sse():
         app,
         host=args.host,
         port=args.port,
-        log_level=args.log_level.lower()
+        log_level=args.log_level.lower(),
+        loop=_UVICORN_LOOP,
+        http=_UVICORN_HTTP,
+        ws="none",
+        access_log=args.access_log,
     )
 
 
@@ -1,5 +1,15 @@
 """Tools module for Google Calendar MCP server."""
 
-from .tools import GOOGLE_CALENDAR_TOOLS
+from typing import Any
 
-__all__ = ["GOOGLE_CALENDAR_TOOLS"] 
\ No newline at end of file
+from .tools import get_google_calendar_tools, validate_tool_args
+
+__all__ = ["GOOGLE_CALENDAR_TOOLS", "get_google_calendar_tools", "validate_tool_args"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve GOOGLE_CALENDAR_TOOLS lazily from the tools module."""
+    if name == "GOOGLE_CALENDAR_TOOLS":
+        from .tools import GOOGLE_CALENDAR_TOOLS
+        return GOOGLE_CALENDAR_TOOLS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,37 +1,185 @@
 """Google Calendar MCP tools definitions."""
 
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Union
+
 from mcp.types import Tool
+from pydantic import BaseModel
+
+from ..schemas import (
+    BatchListEventsRequest,
+    CreateEventRequest,
+    DeleteEventRequest,
+    FreeBusyRequest,
+    ListEventsRequest,
+    UpdateEventRequest,
+)
 
 EMAIL_DOMAIN = "@gmail.com"
 
-GOOGLE_CALENDAR_TOOLS = [
-    Tool(
+# Descriptions used by more than one tool, or formatted from settings
+_CHECK_AVAILABILITY_DESC = (
+    "Check availability for yourself and/or others. When checking for other people in the "
+    f"organization, their emails will always be their name and then {EMAIL_DOMAIN}"
+)
+_EVENT_CALENDAR_ID_DESC = "The ID of the calendar containing the event. Use 'primary' for the user's primary calendar."
+_EVENT_TIMEZONE_DESC = "Timezone for the event (optional, auto-detected if not provided)"
+
+# Event field schemas shared by create-event and update-event
+_RECURRENCE_SCHEMA = {
+    "type": "array",
+    "description": "List of RRULE, EXRULE, RDATE and EXDATE lines for a recurring event",
+    "items": {
+        "type": "string",
+        "description": "Recurrence rule in iCalendar format (e.g., 'RRULE:FREQ=WEEKLY;COUNT=10;BYDAY=TU')",
+    },
+}
+
+_ATTENDEES_SCHEMA = {
+    "type": "array",
+    "description": "The attendees of the event",
+    "items": {
+        "type": "object",
+        "properties": {
+            "email": {
+                "type": "string",
+                "format": "email",
+                "description": "The attendee's email address",
+            },
+            "displayName": {
+                "type": "string",
+                "description": "The attendee's name, if available",
+            },
+            "optional": {
+                "type": "boolean",
+                "description": "Whether this is an optional attendee",
+                "default": False,
+            },
+            "responseStatus": {
+                "type": "string",
+                "description": "The attendee's response status",
+                "enum": ["needsAction", "declined", "tentative", "accepted"],
+                "default": "needsAction",
+            },
+            "comment": {
+                "type": "string",
+                "description": "The attendee's response comment",
+            },
+            "additionalGuests": {
+                "type": "integer",
+                "description": "Number of additional guests",
+                "minimum": 0,
+                "default": 0,
+            },
+        },
+        "required": ["email"],
+    },
+}
+
+_REMINDERS_SCHEMA = {
+    "type": "object",
+    "description": "Reminders for the event",
+    "properties": {
+        "useDefault": {
+            "type": "boolean",
+            "description": "Whether to use the default reminders of the calendar",
+            "default": True,
+        },
+        "overrides": {
+            "type": "array",
+            "description": "Custom reminders for the event",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "method": {
+                        "type": "string",
+                        "description": "The method used by this reminder",
+                        "enum": ["email", "popup"],
+                    },
+                    "minutes": {
+                        "type": "integer",
+                        "description": "Number of minutes before the event to trigger the reminder",
+                    },
+                },
+                "required": ["method", "minutes"],
+            },
+        },
+    },
+}
+
+_VISIBILITY_SCHEMA = {
+    "type": "string",
+    "description": "Visibility of the event",
+    "enum": ["default", "public", "private", "confidential"],
+    "default": "default",
+}
+
+_TRANSPARENCY_SCHEMA = {
+    "type": "string",
+    "description": "Whether the event blocks time on the calendar",
+    "enum": ["opaque", "transparent"],
+    "default": "opaque",
+}
+
+# One get-events query, also the item schema of batch-get-events
+_EVENT_QUERY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "calendarId": {
+            "type": "string",
+            "description": "The ID of the calendar to get events from",
+        },
+        "timeMin": {
+            "type": "string",
+            "description": "The minimum time to get events from",
+        },
+        "timeMax": {
+            "type": "string",
+            "description": "The maximum time to get events from",
+        },
+        "maxResults": {
+            "type": "integer",
+            "description": "The maximum number of events to return per page. Keep this small (20 or less) and page with pageToken",
+            "minimum": 1,
+            "maximum": 2500,
+        },
+        "pageToken": {
+            "type": "string",
+            "description": "Token specifying which result page to return, taken from a previous response's nextPageToken. Optional.",
+        },
+        "fields": {
+            "type": "string",
+            "description": "Partial response selector, e.g. 'items(id,summary,start,end),nextPageToken'. Optional; full events are returned without it.",
+        },
+    },
+    "required": ["calendarId"],
+}
+
+# Tool definitions as plain dicts; see GOOGLE_CALENDAR_TOOLS below
+_TOOL_SPECS = [
+    dict(
         name="get-events",
         description="Get events from calendar",
+        inputSchema=_EVENT_QUERY_SCHEMA,
+    ),
+    dict(
+        name="batch-get-events",
+        description="Get events from several calendars or time ranges in a single batched request",
         inputSchema={
             "type": "object",
             "properties": {
-                "calendarId": {
-                    "type": "string",
-                    "description": "The ID of the calendar to get events from",
-                },
-                "timeMin": {
-                    "type": "string",
-                    "description": "The minimum time to get events from",
-                },
-                "timeMax": {
-                    "type": "string",
-                    "description": "The maximum time to get events from",
-                },
-                "maxResults": {
-                    "type": "number",
-                    "description": "The maximum number of events to return",
+                "items": {
+                    "type": "array",
+                    "description": "The get-events queries to run; results are returned in the same order",
+                    "items": _EVENT_QUERY_SCHEMA,
+                    "minItems": 1,
+                    "maxItems": 50,
                 },
             },
-            "required": ["calendarId"],
+            "required": ["items"],
         },
     ),
-    Tool(
+    dict(
         name="list-calendars",
         description="List all calendars",
         inputSchema={
@@ -40,7 +188,7 @@ GOOGLE_CALENDAR_TOOLS = [
             "required": [],
         },
     ),
-    Tool(
+    dict(
         name="get-timezone-info",
         description="Get the current timezone information from Google Calendar",
         inputSchema={
@@ -49,7 +197,7 @@ GOOGLE_CALENDAR_TOOLS = [
             "required": [],
         },
     ),
-    Tool(
+    dict(
         name="get-current-date",
         description="Get the current date and time in the user's timezone. Useful for models that may have outdated knowledge of the current date.",
         inputSchema={
@@ -58,19 +206,21 @@ GOOGLE_CALENDAR_TOOLS = [
             "required": [],
         },
     ),
-    Tool(
+    dict(
         name="check-availability",
-        description=f"Check availability for yourself and/or others. When checking for other people in the organization, their emails will always be their name and then {EMAIL_DOMAIN}",
+        description=_CHECK_AVAILABILITY_DESC,
         inputSchema={
             "type": "object",
             "properties": {
                 "calendarExpansionMax": {
-                    "type": "number",
+                    "type": "integer",
                     "description": "Maximal number of calendars for which FreeBusy information is to be provided. Optional. Maximum value is 50.",
+                    "maximum": 50,
                 },
                 "groupExpansionMax": {
-                    "type": "number",
+                    "type": "integer",
                     "description": "Maximal number of calendar identifiers to be provided for a single group. Optional. An error is returned for a group with more members than this value. Maximum value is 100.",
+                    "maximum": 100,
                 },
                 "items": {
                     "type": "array",
@@ -101,7 +251,7 @@ GOOGLE_CALENDAR_TOOLS = [
             "required": [],
         },
     ),
-    Tool(
+    dict(
         name="create-event",
         description="Create an event in Google Calendar. Supports both simple and complex events with all advanced features.",
         inputSchema={
@@ -137,55 +287,10 @@ GOOGLE_CALENDAR_TOOLS = [
                 },
                 "timezone": {
                     "type": "string",
-                    "description": "Timezone for the event (optional, auto-detected if not provided)",
-                },
-                "recurrence": {
-                    "type": "array",
-                    "description": "List of RRULE, EXRULE, RDATE and EXDATE lines for a recurring event",
-                    "items": {
-                        "type": "string",
-                        "description": "Recurrence rule in iCalendar format (e.g., 'RRULE:FREQ=WEEKLY;COUNT=10;BYDAY=TU')",
-                    },
-                },
-                                        "attendees": {
-                            "type": "array",
-                            "description": "The attendees of the event",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "email": {
-                                        "type": "string",
-                                        "description": "The attendee's email address",
-                                    },
-                                    "displayName": {
-                                        "type": "string",
-                                        "description": "The attendee's name, if available",
-                                    },
-                                    "optional": {
-                                        "type": "boolean",
-                                        "description": "Whether this is an optional attendee",
-                                        "default": False,
-                                    },
-                            "responseStatus": {
-                                "type": "string",
-                                "description": "The attendee's response status",
-                                "enum": ["needsAction", "declined", "tentative", "accepted"],
-                                "default": "needsAction",
-                            },
-                            "comment": {
-                                "type": "string",
-                                "description": "The attendee's response comment",
-                            },
-                            "additionalGuests": {
-                                "type": "integer",
-                                "description": "Number of additional guests",
-                                "minimum": 0,
-                                "default": 0,
-                            },
-                        },
-                        "required": ["email"],
-                    },
+                    "description": _EVENT_TIMEZONE_DESC,
                 },
+                "recurrence": _RECURRENCE_SCHEMA,
+                "attendees": _ATTENDEES_SCHEMA,
                 "attachments": {
                     "type": "array",
                     "description": "File attachments for the event (Google Drive files only)",
@@ -213,48 +318,9 @@ GOOGLE_CALENDAR_TOOLS = [
                     },
                     "maxItems": 25,
                 },
-                "reminders": {
-                    "type": "object",
-                    "description": "Reminders for the event",
-                    "properties": {
-                        "useDefault": {
-                            "type": "boolean",
-                            "description": "Whether to use the default reminders of the calendar",
-                            "default": True,
-                        },
-                        "overrides": {
-                            "type": "array",
-                            "description": "Custom reminders for the event",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "method": {
-                                        "type": "string",
-                                        "description": "The method used by this reminder",
-                                        "enum": ["email", "popup"],
-                                    },
-                                    "minutes": {
-                                        "type": "integer",
-                                        "description": "Number of minutes before the event to trigger the reminder",
-                                    },
-                                },
-                                "required": ["method", "minutes"],
-                            },
-                        },
-                    },
-                },
-                "visibility": {
-                    "type": "string",
-                    "description": "Visibility of the event",
-                    "enum": ["default", "public", "private", "confidential"],
-                    "default": "default",
-                },
-                "transparency": {
-                    "type": "string",
-                    "description": "Whether the event blocks time on the calendar",
-                    "enum": ["opaque", "transparent"],
-                    "default": "opaque",
-                },
+                "reminders": _REMINDERS_SCHEMA,
+                "visibility": _VISIBILITY_SCHEMA,
+                "transparency": _TRANSPARENCY_SCHEMA,
                 "conferenceData": {
                     "type": "object",
                     "description": "Conference-related information",
@@ -286,7 +352,7 @@ GOOGLE_CALENDAR_TOOLS = [
             "required": ["calendarId", "summary", "start_datetime", "end_datetime"],
         },
     ),
-    Tool(
+    dict(
         name="delete-event",
         description="Delete an event from Google Calendar",
         inputSchema={
@@ -294,7 +360,7 @@ GOOGLE_CALENDAR_TOOLS = [
             "properties": {
                 "calendarId": {
                     "type": "string",
-                    "description": "The ID of the calendar containing the event. Use 'primary' for the user's primary calendar.",
+                    "description": _EVENT_CALENDAR_ID_DESC,
                 },
                 "eventId": {
                     "type": "string",
@@ -310,7 +376,7 @@ GOOGLE_CALENDAR_TOOLS = [
             "required": ["calendarId", "eventId"],
         },
     ),
-    Tool(
+    dict(
         name="update-event",
         description="Update an existing event in Google Calendar. All fields are optional - only specify the fields you want to update.",
         inputSchema={
@@ -318,7 +384,7 @@ GOOGLE_CALENDAR_TOOLS = [
             "properties": {
                 "calendarId": {
                     "type": "string",
-                    "description": "The ID of the calendar containing the event. Use 'primary' for the user's primary calendar.",
+                    "description": _EVENT_CALENDAR_ID_DESC,
                 },
                 "eventId": {
                     "type": "string",
@@ -350,87 +416,13 @@ GOOGLE_CALENDAR_TOOLS = [
                 },
                 "timezone": {
                     "type": "string",
-                    "description": "Timezone for the event (optional, auto-detected if not provided)",
-                },
-                "attendees": {
-                    "type": "array",
-                    "description": "List of attendees for the event",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "email": {
-                                "type": "string",
-                                "description": "The attendee's email address",
-                            },
-                            "displayName": {
-                                "type": "string",
-                                "description": "The attendee's name, if available",
-                            },
-                            "optional": {
-                                "type": "boolean",
-                                "description": "Whether this is an optional attendee",
-                                "default": False,
-                            },
-                            "responseStatus": {
-                                "type": "string",
-                                "description": "The attendee's response status",
-                                "enum": ["needsAction", "declined", "tentative", "accepted"],
-                                "default": "needsAction",
-                            },
-                        },
-                        "required": ["email"],
-                    },
-                },
-                "recurrence": {
-                    "type": "array",
-                    "description": "List of RRULE, EXRULE, RDATE and EXDATE lines for a recurring event",
-                    "items": {
-                        "type": "string",
-                        "description": "Recurrence rule in iCalendar format (e.g., 'RRULE:FREQ=WEEKLY;COUNT=10;BYDAY=TU')",
-                    },
-                },
-                "reminders": {
-                    "type": "object",
-                    "description": "Reminders for the event",
-                    "properties": {
-                        "useDefault": {
-                            "type": "boolean",
-                            "description": "Whether to use the default reminders of the calendar",
-                            "default": True,
-                        },
-                        "overrides": {
-                            "type": "array",
-                            "description": "Custom reminders for the event",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "method": {
-                                        "type": "string",
-                                        "description": "The method used by this reminder",
-                                        "enum": ["email", "popup"],
-                                    },
-                                    "minutes": {
-                                        "type": "integer",
-                                        "description": "Number of minutes before the event to trigger the reminder",
-                                    },
-                                },
-                                "required": ["method", "minutes"],
-                            },
-                        },
-                    },
-                },
-                "visibility": {
-                    "type": "string",
-                    "description": "Visibility of the event",
-                    "enum": ["default", "public", "private", "confidential"],
-                    "default": "default",
-                },
-                "transparency": {
-                    "type": "string",
-                    "description": "Whether the event blocks time on the calendar",
-                    "enum": ["opaque", "transparent"],
-                    "default": "opaque",
+                    "description": _EVENT_TIMEZONE_DESC,
                 },
+                "attendees": _ATTENDEES_SCHEMA,
+                "recurrence": _RECURRENCE_SCHEMA,
+                "reminders": _REMINDERS_SCHEMA,
+                "visibility": _VISIBILITY_SCHEMA,
+                "transparency": _TRANSPARENCY_SCHEMA,
                 "sendUpdates": {
                     "type": "string",
                     "description": "Whether to send notifications about the update to all attendees",
@@ -441,4 +433,51 @@ GOOGLE_CALENDAR_TOOLS = [
             "required": ["calendarId", "eventId"],
         },
     ),
-] 
\ No newline at end of file
+]
+
+
+@lru_cache(maxsize=1)
+def get_google_calendar_tools() -> Tuple[Tool, ...]:
+    """Get the tool manifest, built once per process.
+
+    The specs are written by hand and well-formed, so the Tool models are
+    built with model_construct, skipping pydantic validation of the nested
+    schemas. A tuple, so callers cannot change the shared manifest.
+    """
+    return tuple(Tool.model_construct(**spec) for spec in _TOOL_SPECS)
+
+
+def __getattr__(name: str) -> Any:
+    """Build GOOGLE_CALENDAR_TOOLS on first access (PEP 562).
+
+    Importing this module then does not construct the Tool models; the list
+    is cached in the module globals, so later lookups are plain attributes.
+    """
+    if name == "GOOGLE_CALENDAR_TOOLS":
+        tools = globals()[name] = list(get_google_calendar_tools())
+        return tools
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Tool name -> request model for tools that take arguments. pydantic compiles
+# each model's validator once, when the schema class is defined
+_REQUEST_MODELS = {
+    "get-events": ListEventsRequest,
+    "batch-get-events": BatchListEventsRequest,
+    "check-availability": FreeBusyRequest,
+    "create-event": CreateEventRequest,
+    "delete-event": DeleteEventRequest,
+    "update-event": UpdateEventRequest,
+}
+
+
+def validate_tool_args(name: str, arguments: Dict[str, Any]) -> Union[BaseModel, Dict[str, Any]]:
+    """Validate a tool call's arguments against its request model.
+
+    Returns the validated request, or the arguments unchanged for tools
+    without parameters. Raises pydantic.ValidationError on invalid input.
+    """
+    model = _REQUEST_MODELS.get(name)
+    if model is None:
+        return arguments
+    return model.model_validate(arguments)
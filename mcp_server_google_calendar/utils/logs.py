@@ -1,5 +1,7 @@
 """Logging utilities for Google Calendar MCP server."""
 
+import sys
+
 logs = {
     "init": """
 ╭-------------------------------------------╮
@@ -20,5 +22,4 @@ logs = {
 
 def cool_log(log: str) -> None:
     """Print a cool log message to stderr."""
-    import sys
-    print(log, file=sys.stderr) 
\ No newline at end of file
+    sys.stderr.write(log + "\n") 
\ No newline at end of file
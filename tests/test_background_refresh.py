@@ -0,0 +1,56 @@
+import pytest
+
+from mcp_server_google_calendar.auth import auth
+
+
+class _FailingCreds:
+    def __init__(self):
+        self.calls = 0
+
+    def refresh(self, request):
+        self.calls += 1
+        raise RuntimeError("token endpoint down")
+
+
+@pytest.fixture
+def refresh_state(monkeypatch):
+    monkeypatch.setattr(auth, "_refresh_inflight", False)
+    monkeypatch.setattr(auth, "_refresh_retry_at", 0.0)
+    monkeypatch.setattr(auth, "_get_auth_request", lambda: None)
+    started = []
+
+    class _Thread:
+        def __init__(self, target, args, daemon):
+            self._target, self._args = target, args
+
+        def start(self):
+            started.append(self._args)
+            self._target(*self._args)
+
+    monkeypatch.setattr(auth.threading, "Thread", _Thread)
+    return started
+
+
+def test_failed_refresh_backs_off(monkeypatch, refresh_state):
+    now = 1000.0
+    monkeypatch.setattr(auth.time, "time", lambda: now)
+    creds = _FailingCreds()
+
+    auth._schedule_background_refresh(creds)
+    assert creds.calls == 1
+    assert not auth._refresh_inflight
+    assert auth._refresh_retry_at == now + auth._REFRESH_RETRY_SECONDS
+
+    # Within the back-off window no new refresh starts
+    auth._schedule_background_refresh(creds)
+    assert creds.calls == 1
+
+    now += auth._REFRESH_RETRY_SECONDS
+    auth._schedule_background_refresh(creds)
+    assert creds.calls == 2
+
+
+def test_refresh_in_flight_is_not_duplicated(monkeypatch, refresh_state):
+    monkeypatch.setattr(auth, "_refresh_inflight", True)
+    auth._schedule_background_refresh(_FailingCreds())
+    assert refresh_state == []
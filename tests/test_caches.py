@@ -0,0 +1,62 @@
+import pytest
+
+from mcp_server_google_calendar import server_sse
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(server_sse.time, "monotonic", clock)
+    monkeypatch.setattr(server_sse, "_fb_cache", {})
+    monkeypatch.setattr(server_sse, "_response_cache", {})
+    return clock
+
+
+def test_conflict_cache_evicts_expired_first(monkeypatch, clock):
+    monkeypatch.setattr(server_sse, "_FB_CACHE_MAX", 3)
+    server_sse._store_conflicts(("a",), {})
+    clock.now += server_sse._FB_TTL
+    server_sse._store_conflicts(("b",), {})
+    server_sse._store_conflicts(("c",), {})
+    server_sse._store_conflicts(("d",), {})
+    assert list(server_sse._fb_cache) == [("b",), ("c",), ("d",)]
+
+
+def test_conflict_cache_evicts_oldest_when_all_fresh(monkeypatch, clock):
+    monkeypatch.setattr(server_sse, "_FB_CACHE_MAX", 3)
+    for key in ("a", "b", "c"):
+        server_sse._store_conflicts((key,), {})
+    # Storing "a" again makes "b" the oldest entry
+    server_sse._store_conflicts(("a",), {})
+    server_sse._store_conflicts(("d",), {})
+    assert list(server_sse._fb_cache) == [("c",), ("a",), ("d",)]
+
+
+def test_response_cache_ttl(clock):
+    key = ("get_events", "primary")
+    server_sse._store_response(key, "payload")
+    assert server_sse._cached_response(key) == "payload"
+    clock.now += server_sse._RESPONSE_TTL["get_events"]
+    assert server_sse._cached_response(key) is None
+
+
+def test_response_cache_evicts_oldest_when_all_fresh(monkeypatch, clock):
+    monkeypatch.setattr(server_sse, "_RESPONSE_CACHE_MAX", 2)
+    for i in range(5):
+        server_sse._store_response(("list_calendars", i), str(i))
+    assert list(server_sse._response_cache) == [("list_calendars", 3), ("list_calendars", 4)]
+
+
+def test_invalidate_events_keeps_other_tools(clock):
+    server_sse._store_response(("get_events", "primary"), "events")
+    server_sse._store_response(("list_calendars",), "calendars")
+    server_sse._invalidate_events()
+    assert list(server_sse._response_cache) == [("list_calendars",)]
@@ -0,0 +1,154 @@
+import threading
+
+import pytest
+
+from mcp_server_google_calendar import server_sse
+
+
+class _Request:
+    def __init__(self, service, body):
+        self._service = service
+        self.body = body
+
+    def execute(self, http=None):
+        return self._service.execute(self.body)
+
+
+class _FreeBusy:
+    def __init__(self, service):
+        self._service = service
+
+    def query(self, body):
+        return _Request(self._service, body)
+
+
+class _FakeService:
+    """Answers free/busy queries with one empty busy list per calendar."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.queries = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def freebusy(self):
+        return _FreeBusy(self)
+
+    def execute(self, body):
+        self.release.wait(5)
+        self.queries.append(body)
+        if self.error is not None:
+            raise self.error
+        return {"calendars": {item["id"]: {"busy": []} for item in body["items"]}}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    fake = _FakeService()
+    monkeypatch.setattr(server_sse, "get_calendar_service", lambda: fake)
+    monkeypatch.setattr(server_sse, "_http_for_thread", lambda: None)
+    return fake
+
+
+def _body(calendar_id, time_min="2024-01-01T09:00:00Z"):
+    return {
+        "timeMin": time_min,
+        "timeMax": "2024-01-01T10:00:00Z",
+        "items": [{"id": calendar_id}],
+    }
+
+
+def _waiter():
+    return {"event": threading.Event(), "lead": False, "result": None, "error": None}
+
+
+def test_single_query(service):
+    batcher = server_sse._FreeBusyBatcher()
+    res = batcher.query(_body("a@example.com"))
+    assert res == {"calendars": {"a@example.com": {"busy": []}}}
+    assert not batcher._busy
+
+
+def test_failed_send_wakes_every_caller(service):
+    service.error = RuntimeError("backend down")
+    service.release.clear()
+    batcher = server_sse._FreeBusyBatcher()
+    errors = []
+
+    def call(calendar_id):
+        try:
+            batcher.query(_body(calendar_id))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call, args=(f"{i}@example.com",)) for i in range(5)]
+    for t in threads:
+        t.start()
+    service.release.set()
+    for t in threads:
+        t.join(5)
+
+    assert not any(t.is_alive() for t in threads)
+    assert len(errors) == 5
+    assert all(str(e) == "backend down" for e in errors)
+    assert not batcher._busy
+    assert not batcher._pending
+
+
+def test_unsent_batch_still_wakes_callers(monkeypatch, service):
+    batcher = server_sse._FreeBusyBatcher()
+
+    def interrupted(batch):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(batcher, "_send", interrupted)
+    waiters = [_waiter() for _ in range(3)]
+    batcher._busy = True
+    batcher._pending = [(_body(f"{i}@example.com"), w) for i, w in enumerate(waiters)]
+
+    with pytest.raises(KeyboardInterrupt):
+        batcher._run()
+
+    assert all(w["event"].is_set() for w in waiters)
+    assert all(isinstance(w["error"], RuntimeError) for w in waiters)
+    assert not batcher._busy
+
+
+def test_same_window_merge_is_split_at_item_limit(service):
+    batcher = server_sse._FreeBusyBatcher()
+    ids = [f"{i}@example.com" for i in range(server_sse._FREEBUSY_MAX_ITEMS + 10)]
+    batch = [(_body(calendar_id), _waiter()) for calendar_id in ids]
+
+    batcher._send(batch)
+
+    assert [len(q["items"]) for q in service.queries] == [server_sse._FREEBUSY_MAX_ITEMS, 10]
+    for calendar_id, (_, waiter) in zip(ids, batch):
+        assert calendar_id in waiter["result"]["calendars"]
+
+
+def test_run_sends_at_most_item_limit_queries(monkeypatch, service):
+    batcher = server_sse._FreeBusyBatcher()
+    sent = []
+    monkeypatch.setattr(batcher, "_send", lambda batch: sent.append(len(batch)))
+    waiters = [_waiter() for _ in range(server_sse._FREEBUSY_MAX_ITEMS + 5)]
+    batcher._busy = True
+    batcher._pending = [(_body(f"{i}@example.com"), w) for i, w in enumerate(waiters)]
+
+    batcher._run()
+
+    assert sent == [server_sse._FREEBUSY_MAX_ITEMS]
+    assert len(batcher._pending) == 5
+    # The first caller left in the queue sends the rest
+    assert batcher._pending[0][1]["lead"]
+    assert batcher._busy
+
+
+def test_waiting_caller_times_out(monkeypatch, service):
+    monkeypatch.setattr(server_sse, "_FB_WAIT_TIMEOUT", 0.05)
+    batcher = server_sse._FreeBusyBatcher()
+    # A leader that never finishes
+    batcher._busy = True
+
+    with pytest.raises(TimeoutError):
+        batcher.query(_body("a@example.com"))
+    assert not batcher._pending
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from mcp_server_google_calendar.auth import auth
+
+
+def _creds(token):
+    return Credentials(
+        token=token,
+        refresh_token="refresh",
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client",
+        client_secret="secret",
+    )
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth, "_TOKEN_PATH", tmp_path / "token.json")
+    monkeypatch.setattr(auth, "_TOKEN_LOG_PATH", tmp_path / "token.json.log")
+    monkeypatch.setattr(auth, "_token_log_compacted", False)
+    monkeypatch.setattr(auth, "_CREDS_CACHE", {})
+    monkeypatch.setattr(auth, "Observer", None)
+    return tmp_path
+
+
+def test_tail_read_spans_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth, "_TOKEN_TAIL_CHUNK", 8)
+    log = tmp_path / "token.json.log"
+    log.write_bytes(b'{"token": "old"}\n{"token": "' + b"x" * 40 + b'"}\n\n')
+    line, terminated = auth._read_token_tail(log)
+    assert line == b'{"token": "' + b"x" * 40 + b'"}'
+    assert terminated
+
+
+def test_tail_read_unterminated_line(tmp_path):
+    log = tmp_path / "token.json.log"
+    log.write_bytes(b'{"token": "a"}\n{"token": "b"}')
+    assert auth._read_token_tail(log) == (b'{"token": "b"}', False)
+
+
+def test_first_save_writes_token_document(store):
+    auth.save_credentials(_creds("first"))
+    assert json.loads((store / "token.json").read_text())["token"] == "first"
+    assert not (store / "token.json.log").exists()
+
+
+def test_refresh_appends_to_log_only(store):
+    auth.save_credentials(_creds("first"))
+    auth.save_credentials(_creds("second"))
+    auth.save_credentials(_creds("second"))
+
+    assert json.loads((store / "token.json").read_text())["token"] == "first"
+    assert len((store / "token.json.log").read_bytes().splitlines()) == 1
+    auth._token_log_compacted = True
+    assert auth.load_saved_credentials().token == "second"
+
+
+def test_torn_log_line_falls_back_to_token_file(store):
+    auth.save_credentials(_creds("first"))
+    (store / "token.json.log").write_bytes(b'{"token": "sec')
+    auth._token_log_compacted = True
+    assert auth.load_saved_credentials().token == "first"
+
+
+def test_compaction_folds_log_into_token_file(store):
+    auth.save_credentials(_creds("first"))
+    auth.save_credentials(_creds("second"))
+    auth.save_credentials(_creds("third"))
+
+    assert auth.load_saved_credentials().token == "third"
+    assert json.loads((store / "token.json").read_text())["token"] == "third"
+    assert not (store / "token.json.log").exists()
+
+
+def test_compaction_rewrites_token_file_written_as_log(store):
+    lines = [_creds(t).to_json() for t in ("first", "second")]
+    (store / "token.json").write_text("\n".join(lines) + "\n")
+
+    assert auth.load_saved_credentials().token == "second"
+    assert json.loads((store / "token.json").read_text())["token"] == "second"
+
+
+def test_deleted_token_file_ignores_leftover_log(store):
+    auth.save_credentials(_creds("first"))
+    auth.save_credentials(_creds("second"))
+    (store / "token.json").unlink()
+    auth._token_log_compacted = True
+
+    assert auth.load_saved_credentials() is None
+    auth.save_credentials(_creds("new"))
+    assert not (store / "token.json.log").exists()
+    assert auth.load_saved_credentials().token == "new"
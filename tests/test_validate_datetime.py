@@ -0,0 +1,29 @@
+from datetime import datetime
+
+import pytest
+import pytz
+
+from mcp_server_google_calendar.server import validate_and_fix_datetime
+
+
+@pytest.mark.parametrize(
+    "tz_name, value",
+    [
+        ("America/New_York", "2024-07-01T09:00:00"),
+        ("America/New_York", "2024-07-01"),
+        # Repeated hour on the fall-back day
+        ("America/New_York", "2024-11-03T01:30:00"),
+        # Skipped hour on the spring-forward day
+        ("America/New_York", "2024-03-10T02:30:00"),
+        ("Australia/Sydney", "2024-04-07T02:30:00"),
+        ("Australia/Sydney", "2024-10-06T02:30:00"),
+    ],
+)
+def test_matches_pytz_localize(tz_name, value):
+    naive = datetime.fromisoformat(value if "T" in value else value + "T00:00:00")
+    expected = pytz.timezone(tz_name).localize(naive).isoformat()
+    assert validate_and_fix_datetime(value, tz_name) == expected
+
+
+def test_unknown_zone_returns_input():
+    assert validate_and_fix_datetime("2024-07-01", "Not/AZone") == "2024-07-01"